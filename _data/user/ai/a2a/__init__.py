@@ -17,7 +17,7 @@ from .models import (
     AgentCapability
 )
 
-from .service import A2AService
+from .service import A2AService, BlobStore
 from .example_router import router, register_a2a_routes
 
 from .exceptions import (
@@ -50,6 +50,7 @@ __all__ = [
     
     # Service
     'A2AService',
+    'BlobStore',
     
     # Router
     'router',
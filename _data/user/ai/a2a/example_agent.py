@@ -6,6 +6,10 @@ This module demonstrates how to create and use an A2A agent with custom capabili
 import asyncio
 import json
 import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
@@ -22,7 +26,7 @@ from .models import (
     AgentCard
 )
 from .service import A2AService
-from .router import register_a2a_routes
+from .example_router import register_a2a_routes
 
 # Configure logging
 logging.basicConfig(
@@ -31,20 +35,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sentence boundary used by the summarizer
+_SENT_RE = re.compile(r'\. ')
+
+# Word lists used by the sentiment analyzer
+_WORD_RE = re.compile(r'[a-z]+')
+_POSITIVE = frozenset(("good", "great", "excellent", "awesome", "happy"))
+_NEGATIVE = frozenset(("bad", "terrible", "awful", "horrible", "sad"))
+
+# Capability schemas, shared by every agent instance
+_SUMMARIZE_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "text": {"type": "string", "description": "The text to summarize"},
+        "max_length": {"type": "integer", "description": "Maximum length of the summary"}
+    },
+    "required": ["text"]
+}
+
+_SUMMARIZE_OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string", "description": "The generated summary"},
+        "original_length": {"type": "integer", "description": "Length of the original text"},
+        "summary_length": {"type": "integer", "description": "Length of the summary"}
+    }
+}
+
+_SENTIMENT_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "text": {"type": "string", "description": "The text to analyze"}
+    },
+    "required": ["text"]
+}
+
+_SENTIMENT_OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "sentiment": {"type": "string", "enum": ["positive", "negative", "neutral"], "description": "The detected sentiment"},
+        "confidence": {"type": "number", "description": "Confidence score between 0 and 1"},
+        "tokens_analyzed": {"type": "integer", "description": "Number of tokens analyzed"}
+    }
+}
+
+@dataclass(slots=True)
+class _ActiveTask:
+    """Bookkeeping for a task handled by this agent."""
+    task_id: UUID
+    capability: str
+    started_at: float
+    state: str = "running"
+    result: Any = None
+
 class ExampleAgent:
     """An example A2A agent with sample capabilities."""
     
-    def __init__(self, agent_id: str, agent_name: str, port: int = 8000):
+    def __init__(self, agent_id: str, agent_name: str, port: int = 8000, max_active_tasks: int = 1000):
         """Initialize the example agent.
         
         Args:
             agent_id: Unique identifier for this agent
             agent_name: Human-readable name for this agent
             port: Port to run the FastAPI server on
+            max_active_tasks: Maximum number of tasks to keep track of
         """
         self.agent_id = agent_id
         self.agent_name = agent_name
         self.port = port
+        self.max_active_tasks = max_active_tasks
         
         # Initialize the A2A service
         self.a2a_service = A2AService(
@@ -59,11 +118,33 @@ class ExampleAgent:
         # Initialize FastAPI app
         self.app = FastAPI(title=f"{agent_name} (A2A Agent)")
         
-        # Register A2A routes
-        register_a2a_routes(self.app)
+        # Register A2A routes backed by this agent's service
+        register_a2a_routes(self.app, self.a2a_service)
+        
+        # Store active tasks, oldest first
+        self.active_tasks: "OrderedDict[UUID, _ActiveTask]" = OrderedDict()
+    
+    def _track_task(self, task: Task, capability: str) -> _ActiveTask:
+        """Start tracking a task, evicting the oldest finished one when full.
+        
+        With max_active_tasks of zero or less the entry is returned but not kept.
+        """
+        entry = _ActiveTask(task_id=task.task_id, capability=capability, started_at=time.monotonic())
+        if self.max_active_tasks <= 0:
+            return entry
+        
+        self.active_tasks.pop(task.task_id, None)
+        while len(self.active_tasks) >= self.max_active_tasks:
+            evict = next(
+                (task_id for task_id, tracked in self.active_tasks.items() if tracked.state != "running"),
+                None
+            )
+            if evict is None:
+                evict = next(iter(self.active_tasks))
+            del self.active_tasks[evict]
         
-        # Store active tasks
-        self.active_tasks: Dict[UUID, Dict[str, Any]] = {}
+        self.active_tasks[task.task_id] = entry
+        return entry
     
     def _register_capabilities(self) -> None:
         """Register this agent's capabilities."""
@@ -71,43 +152,16 @@ class ExampleAgent:
         self.a2a_service.register_capability(
             name="summarize_text",
             description="Summarize a given text",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "The text to summarize"},
-                    "max_length": {"type": "integer", "description": "Maximum length of the summary"}
-                },
-                "required": ["text"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "summary": {"type": "string", "description": "The generated summary"},
-                    "original_length": {"type": "integer", "description": "Length of the original text"},
-                    "summary_length": {"type": "integer", "description": "Length of the summary"}
-                }
-            }
+            input_schema=_SUMMARIZE_INPUT_SCHEMA,
+            output_schema=_SUMMARIZE_OUTPUT_SCHEMA
         )
         
         # Example capability: Sentiment analysis
         self.a2a_service.register_capability(
             name="analyze_sentiment",
             description="Analyze the sentiment of a given text",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "The text to analyze"}
-                },
-                "required": ["text"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "sentiment": {"type": "string", "enum": ["positive", "negative", "neutral"], "description": "The detected sentiment"},
-                    "confidence": {"type": "number", "description": "Confidence score between 0 and 1"},
-                    "tokens_analyzed": {"type": "integer", "description": "Number of tokens analyzed"}
-                }
-            }
+            input_schema=_SENTIMENT_INPUT_SCHEMA,
+            output_schema=_SENTIMENT_OUTPUT_SCHEMA
         )
         
         # Register task handlers
@@ -126,21 +180,34 @@ class ExampleAgent:
         This is a simple implementation that just takes the first few sentences.
         In a real application, you would use a proper summarization model.
         """
-        text = task.parameters.get("text", "")
-        max_length = task.parameters.get("max_length", 200)
-        
-        # Simple summarization: take first few sentences
-        sentences = text.split(". ")
-        summary = ". ".join(sentences[:3]) + "."
-        
-        if len(summary) > max_length:
-            summary = summary[:max_length].rsplit(' ', 1)[0] + "..."
-        
-        return {
-            "summary": summary,
-            "original_length": len(text),
-            "summary_length": len(summary)
-        }
+        entry = self._track_task(task, "summarize_text")
+        try:
+            text = task.parameters.get("text", "")
+            max_length = task.parameters.get("max_length", 200)
+            
+            # Simple summarization: take first few sentences, cutting at the
+            # third sentence boundary without splitting the whole text
+            cut = len(text)
+            for i, match in enumerate(_SENT_RE.finditer(text)):
+                if i == 2:
+                    cut = match.start()
+                    break
+            summary = text[:cut] + "."
+            
+            if len(summary) > max_length:
+                summary = summary[:max_length].rsplit(' ', 1)[0] + "..."
+            
+            entry.result = {
+                "summary": summary,
+                "original_length": len(text),
+                "summary_length": len(summary)
+            }
+            entry.state = "completed"
+            return entry.result
+        finally:
+            # A handler error must not leave the entry counted as running
+            if entry.state == "running":
+                entry.state = "failed"
     
     async def _handle_analyze_sentiment(self, task: Task) -> Dict[str, Any]:
         """Handle sentiment analysis tasks.
@@ -148,30 +215,40 @@ class ExampleAgent:
         This is a simple implementation that does basic sentiment analysis.
         In a real application, you would use a proper sentiment analysis model.
         """
-        text = task.parameters.get("text", "").lower()
-        
-        # Simple sentiment analysis
-        positive_words = ["good", "great", "excellent", "awesome", "happy"]
-        negative_words = ["bad", "terrible", "awful", "horrible", "sad"]
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        
-        if positive_count > negative_count:
-            sentiment = "positive"
-            confidence = min(0.9, 0.5 + (positive_count * 0.1))
-        elif negative_count > positive_count:
-            sentiment = "negative"
-            confidence = min(0.9, 0.5 + (negative_count * 0.1))
-        else:
-            sentiment = "neutral"
-            confidence = 0.5
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": round(confidence, 2),
-            "tokens_analyzed": len(text.split())
-        }
+        entry = self._track_task(task, "analyze_sentiment")
+        try:
+            text = task.parameters.get("text", "").lower()
+            
+            # Simple sentiment analysis: tokenize once, then set lookups
+            positive_count = 0
+            negative_count = 0
+            for token in _WORD_RE.findall(text):
+                if token in _POSITIVE:
+                    positive_count += 1
+                elif token in _NEGATIVE:
+                    negative_count += 1
+            
+            if positive_count > negative_count:
+                sentiment = "positive"
+                confidence = min(0.9, 0.5 + (positive_count * 0.1))
+            elif negative_count > positive_count:
+                sentiment = "negative"
+                confidence = min(0.9, 0.5 + (negative_count * 0.1))
+            else:
+                sentiment = "neutral"
+                confidence = 0.5
+            
+            entry.result = {
+                "sentiment": sentiment,
+                "confidence": round(confidence, 2),
+                "tokens_analyzed": len(text.split())
+            }
+            entry.state = "completed"
+            return entry.result
+        finally:
+            # A handler error must not leave the entry counted as running
+            if entry.state == "running":
+                entry.state = "failed"
     
     async def _handle_general_message(self, message: A2AMessage) -> None:
         """Handle general messages from other agents."""
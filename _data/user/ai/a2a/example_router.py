@@ -1,10 +1,13 @@
 """
 FastAPI router for A2A (Agent-to-Agent) protocol endpoints.
 """
-from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import hashlib
+from typing import Dict, List, Optional, Any, Tuple
+from uuid import UUID
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from .models import (
     A2AMessage,
@@ -25,19 +28,50 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# Dependency to get A2A service
-def get_a2a_service() -> A2AService:
-    """Get A2A service instance.
+# Serialized agent cards keyed by agent ID: (card JSON, payload, etag).
+# Entries are rebuilt when the service's cached card JSON changes.
+_CARD_CACHE: Dict[str, Tuple[str, bytes, str]] = {}
+
+# Preformatted 400 response for request errors that carry no detail
+_ERR_INVALID_MSG = Response(
+    content=to_json({"detail": "Invalid message"}),
+    status_code=status.HTTP_400_BAD_REQUEST,
+    media_type="application/json"
+)
+
+def _bad_request(error: Exception, prefix: str = "") -> Response:
+    """Build a 400 response directly instead of raising HTTPException.
     
-    In a real application, you would get the service from your dependency injection system.
-    This is a simplified version that creates a new instance each time.
+    The body matches the shape FastAPI produces for HTTPException.
     """
+    detail = str(error)
+    if not detail:
+        return _ERR_INVALID_MSG
+    return Response(
+        content=to_json({"detail": f"{prefix}{detail}"}),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        media_type="application/json"
+    )
+
+def _create_default_service() -> A2AService:
+    """Create the fallback A2A service used when none is supplied."""
     # TODO: Replace with your actual service initialization
-    service = A2AService(
+    return A2AService(
         agent_id="example_agent",
         agent_name="Example Agent",
         agent_description="An example A2A agent"
     )
+
+# Dependency to get A2A service
+def get_a2a_service(request: Request) -> A2AService:
+    """Get the A2A service instance shared by the application.
+    
+    The service lives on ``app.state`` for the lifetime of the process, so
+    capability and handler registries are built once rather than per request.
+    """
+    service = getattr(request.app.state, "a2a_service", None)
+    if service is None:
+        service = request.app.state.a2a_service = _create_default_service()
     return service
 
 # Request/Response Models
@@ -67,7 +101,6 @@ class StatusUpdateRequest(BaseModel):
 # Endpoints
 @router.post("/messages", response_model=Dict[str, Any])
 async def send_message(
-    request: Request,
     message_req: MessageRequest,
     a2a_service: A2AService = Depends(get_a2a_service)
 ) -> Dict[str, Any]:
@@ -98,7 +131,7 @@ async def send_message(
             recipient_id=message_req.recipient_id,
             message_type=MessageType(message_req.message_type),
             parts=parts,
-            conversation_id=message_req.conversation_id,
+            conversation_id=UUID(message_req.conversation_id) if message_req.conversation_id else None,
             task=task,
             metadata=message_req.metadata or {}
         )
@@ -111,10 +144,7 @@ async def send_message(
         }
         
     except (ValueError, KeyError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid request: {str(e)}"
-        )
+        return _bad_request(e, "Invalid request: ")
     except A2AError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -128,7 +158,6 @@ async def send_message(
 
 @router.post("/tasks", response_model=Dict[str, Any])
 async def execute_task(
-    request: Request,
     task_req: TaskRequest,
     a2a_service: A2AService = Depends(get_a2a_service)
 ) -> Dict[str, Any]:
@@ -147,27 +176,24 @@ async def execute_task(
             timeout=task_req.timeout
         )
         
-        # Prepare the response
-        response = {
-            "task_id": str(task.task_id),
-            "status": task.status.value,
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat() if task.updated_at else None,
-            "result": task.result,
-            "error": task.error,
-            "metadata": task.metadata
-        }
-        
-        return {
+        # Prepare the response; UUIDs, enums and datetimes are encoded natively
+        payload = to_json({
             "success": task.status == TaskStatus.COMPLETED,
-            "data": response
-        }
+            "data": {
+                "task_id": task.task_id,
+                "status": task.status,
+                "created_at": task.created_at,
+                "updated_at": task.updated_at,
+                "result": task.result,
+                "error": task.error,
+                "metadata": task.metadata
+            }
+        })
+        
+        return Response(content=payload, media_type="application/json")
         
     except (AgentNotFoundError, ValueError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+        return _bad_request(e)
     except TimeoutError as e:
         raise HTTPException(
             status_code=status.HTTP_408_REQUEST_TIMEOUT,
@@ -179,22 +205,33 @@ async def execute_task(
             detail=f"Internal server error: {str(e)}"
         )
 
+def _get_cached_card(a2a_service: A2AService) -> Tuple[bytes, str]:
+    """Return the serialized agent card and its ETag, building them on first use."""
+    card_json = a2a_service.get_agent_card_json()
+    cached = _CARD_CACHE.get(a2a_service.agent_id)
+    if cached is None or cached[0] is not card_json:
+        payload = b'{"success":true,"data":' + card_json.encode() + b'}'
+        etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+        cached = _CARD_CACHE[a2a_service.agent_id] = (card_json, payload, etag)
+    return cached[1], cached[2]
+
 @router.get("/capabilities", response_model=Dict[str, Any])
 async def get_capabilities(
-    request: Request,
+    if_none_match: Optional[str] = Header(None),
     a2a_service: A2AService = Depends(get_a2a_service)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get the capabilities of this agent.
     
     This endpoint returns the agent's capabilities in the form of an AgentCard.
+    Responses carry an ETag so repeated discovery can be answered with a 304.
     """
     try:
-        agent_card = a2a_service.get_agent_card()
-        return {
-            "success": True,
-            "data": agent_card.dict()
-        }
+        payload, etag = _get_cached_card(a2a_service)
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=payload, media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -203,8 +240,9 @@ async def get_capabilities(
 
 @router.post("/status", response_model=Dict[str, Any])
 async def update_task_status(
-    request: Request,
     status_req: StatusUpdateRequest,
+    x_agent_id: str = Header("unknown", alias="X-Agent-ID"),
+    x_conversation_id: Optional[str] = Header(None, alias="X-Conversation-ID"),
     a2a_service: A2AService = Depends(get_a2a_service)
 ) -> Dict[str, Any]:
     """
@@ -216,10 +254,10 @@ async def update_task_status(
     try:
         # Send status update
         await a2a_service.send_status_update(
-            task_id=status_req.task_id,
+            task_id=UUID(status_req.task_id),
             status=TaskStatus(status_req.status),
-            recipient_id=request.headers.get("X-Agent-ID", "unknown"),
-            conversation_id=request.headers.get("X-Conversation-ID"),
+            recipient_id=x_agent_id,
+            conversation_id=UUID(x_conversation_id) if x_conversation_id else None,
             result=status_req.result,
             error=status_req.error
         )
@@ -230,10 +268,7 @@ async def update_task_status(
         }
         
     except (ValueError, TaskNotFoundError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+        return _bad_request(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -252,11 +287,11 @@ async def webhook(
     This endpoint receives messages from other agents and processes them.
     """
     try:
-        # Parse the incoming message
-        data = await request.json()
+        # Decode the raw body straight into an A2AMessage in a single pass
+        message = A2AMessage.model_validate_json(await request.body())
         
         # Process the message
-        await a2a_service.process_message(data)
+        await a2a_service.process_message(message)
         
         return {
             "success": True,
@@ -264,10 +299,7 @@ async def webhook(
         }
         
     except (ValueError, KeyError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid message format: {str(e)}"
-        )
+        return _bad_request(e, "Invalid message format: ")
     except A2AError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -279,7 +311,21 @@ async def webhook(
             detail=f"Failed to process message: {str(e)}"
         )
 
-def register_a2a_routes(app):
-    """Register A2A routes with the FastAPI application."""
+def register_a2a_routes(app, a2a_service: Optional[A2AService] = None):
+    """Register A2A routes with the FastAPI application.
+    
+    Args:
+        app: The FastAPI application
+        a2a_service: Service to serve requests with; a default one is
+            created at startup if not provided
+    """
+    if a2a_service is not None:
+        app.state.a2a_service = a2a_service
+    else:
+        @app.on_event("startup")
+        async def _init_a2a_service() -> None:
+            if getattr(app.state, "a2a_service", None) is None:
+                app.state.a2a_service = _create_default_service()
+    
     app.include_router(router)
     return app
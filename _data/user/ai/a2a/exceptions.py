@@ -4,55 +4,62 @@ Exceptions for the A2A (Agent-to-Agent) protocol implementation.
 
 class A2AError(Exception):
     """Base exception for all A2A-related errors."""
-    pass
+    __slots__ = ()
 
 class AgentNotFoundError(A2AError):
     """Raised when a referenced agent cannot be found."""
-    pass
+    __slots__ = ()
 
 class InvalidMessageError(A2AError):
     """Raised when a message is malformed or invalid."""
-    pass
+    __slots__ = ()
 
 class TaskNotFoundError(A2AError):
     """Raised when a referenced task cannot be found."""
-    pass
+    __slots__ = ()
 
 class CapabilityNotFoundError(A2AError):
     """Raised when a requested capability is not available."""
-    pass
+    __slots__ = ()
 
 class AuthenticationError(A2AError):
     """Raised when authentication fails."""
-    pass
+    __slots__ = ()
 
 class AuthorizationError(A2AError):
     """Raised when an operation is not authorized."""
-    pass
+    __slots__ = ()
 
 class RateLimitExceededError(A2AError):
     """Raised when rate limits are exceeded."""
-    pass
+    __slots__ = ()
 
 class TimeoutError(A2AError):
     """Raised when an operation times out."""
-    pass
+    __slots__ = ()
 
 class ValidationError(A2AError):
     """Raised when input validation fails."""
-    pass
+    __slots__ = ()
 
 class CommunicationError(A2AError):
     """Raised when there is a communication error with another agent."""
-    pass
+    __slots__ = ()
 
 class TaskExecutionError(A2AError):
     """Raised when a task fails to execute."""
+    __slots__ = ('task_id', 'message', 'original_error')
+
     def __init__(self, task_id: str, message: str, original_error: Exception = None):
         self.task_id = task_id
+        self.message = message
         self.original_error = original_error
-        super().__init__(f"Error executing task {task_id}: {message}")
+        super().__init__(task_id, message)
+
+    def __str__(self) -> str:
+        # Formatted on demand so raising the error stays cheap
+        return f"Error executing task {self.task_id}: {self.message}"
 
 class UnsupportedContentTypeError(A2AError):
     """Raised when an unsupported content type is encountered."""
-    pass
+    __slots__ = ()
@@ -6,9 +6,11 @@ interoperability between different AI agents.
 """
 from enum import Enum
 from typing import Dict, List, Optional, Any, Union
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from ...utils import utcnow_coarse_aware, uuid7
 
 class MessageType(str, Enum):
     """Types of messages in the A2A protocol."""
@@ -18,6 +20,11 @@ class MessageType(str, Enum):
     STATUS_UPDATE = "status_update"
     CAPABILITY_DISCOVERY = "capability_discovery"
 
+# Stamp each member with its position so dispatch tables can be plain lists
+for _index, _member in enumerate(MessageType):
+    _member._index = _index
+del _index, _member
+
 class TaskStatus(str, Enum):
     """Status of an A2A task."""
     PENDING = "pending"
@@ -38,15 +45,40 @@ class ContentType(str, Enum):
     VIDEO_MP4 = "video/mp4"
     PDF = "application/pdf"
 
+# Content types whose payload is sent by reference rather than inline
+BINARY_CONTENT_TYPES = frozenset({
+    ContentType.IMAGE_PNG,
+    ContentType.IMAGE_JPEG,
+    ContentType.AUDIO_MP3,
+    ContentType.VIDEO_MP4,
+    ContentType.PDF,
+})
+
 class MessagePart(BaseModel):
-    """A single part of an A2A message with content and metadata."""
+    """A single part of an A2A message with content and metadata.
+    
+    Binary payloads may be carried out of band: ``content`` is then ``None``
+    and ``content_ref`` points at the stored bytes.
+    """
+    model_config = ConfigDict(frozen=True)
+
     content_type: ContentType = Field(..., description="MIME type of the content")
-    content: Union[str, bytes, Dict[str, Any]] = Field(..., description="The actual content")
+    content: Optional[Union[str, bytes, Dict[str, Any]]] = Field(None, description="The actual content")
+    content_ref: Optional[str] = Field(None, description="Reference to out-of-band binary content")
+    content_sha256: Optional[str] = Field(None, description="SHA-256 of the out-of-band content")
     name: Optional[str] = Field(None, description="Name or identifier for this part")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @model_validator(mode='after')
+    def check_content(self) -> 'MessagePart':
+        if self.content is None and self.content_ref is None:
+            raise ValueError("Either content or content_ref must be provided")
+        return self
+
 class AgentCapability(BaseModel):
     """Describes a capability of an A2A agent."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the capability")
     description: str = Field(..., description="Description of what the capability does")
     input_schema: Optional[Dict[str, Any]] = Field(None, description="JSON Schema for input parameters")
@@ -55,6 +87,8 @@ class AgentCapability(BaseModel):
 
 class AgentCard(BaseModel):
     """Metadata about an A2A agent that describes its capabilities."""
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str = Field(..., description="Unique identifier for the agent")
     name: str = Field(..., description="Human-readable name of the agent")
     description: str = Field(..., description="Description of the agent's purpose")
@@ -64,10 +98,10 @@ class AgentCard(BaseModel):
 
 class Task(BaseModel):
     """Represents a task in the A2A protocol."""
-    task_id: UUID = Field(default_factory=uuid4, description="Unique identifier for the task")
+    task_id: UUID = Field(default_factory=uuid7, description="Unique identifier for the task")
     parent_task_id: Optional[UUID] = Field(None, description="ID of the parent task, if any")
     status: TaskStatus = Field(TaskStatus.PENDING, description="Current status of the task")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="When the task was created")
+    created_at: datetime = Field(default_factory=utcnow_coarse_aware, description="When the task was created")
     updated_at: Optional[datetime] = Field(None, description="When the task was last updated")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Task parameters")
     result: Optional[Dict[str, Any]] = Field(None, description="Task result when completed")
@@ -76,22 +110,36 @@ class Task(BaseModel):
 
 class A2AMessage(BaseModel):
     """Base message format for A2A communication."""
-    message_id: UUID = Field(default_factory=uuid4, description="Unique message identifier")
-    conversation_id: UUID = Field(default_factory=uuid4, description="Conversation identifier")
+    model_config = ConfigDict(frozen=True)
+
+    message_id: UUID = Field(default_factory=uuid7, description="Unique message identifier")
+    conversation_id: UUID = Field(default_factory=uuid7, description="Conversation identifier")
     message_type: MessageType = Field(..., description="Type of the message")
     sender_id: str = Field(..., description="ID of the sending agent")
     recipient_id: str = Field(..., description="ID of the intended recipient agent")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="When the message was sent")
+    timestamp: datetime = Field(default_factory=utcnow_coarse_aware, description="When the message was sent")
     parts: List[MessagePart] = Field(default_factory=list, description="Message content parts")
     task: Optional[Task] = Field(None, description="Task details, if this is a task-related message")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    @validator('timestamp', pre=True, always=True)
+    @field_validator('timestamp', mode='before')
+    @classmethod
     def set_timestamp(cls, v):
-        return v or datetime.utcnow()
+        return v or utcnow_coarse_aware()
+
+    @classmethod
+    def internal(cls, **fields: Any) -> 'A2AMessage':
+        """Build a message from trusted, already-typed values without validation.
+        
+        Only for messages constructed by the local agent; anything received
+        from another agent must go through normal validation.
+        """
+        return cls.model_construct(**fields)
 
 class A2AResponse(BaseModel):
     """Standard response format for A2A API calls."""
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="Whether the operation was successful")
     data: Optional[Dict[str, Any]] = Field(None, description="Response data")
     error: Optional[Dict[str, Any]] = Field(None, description="Error details if the operation failed")
@@ -5,11 +5,15 @@ This module implements the core service for handling A2A protocol communications
 between agents, including task management, message routing, and capability discovery.
 """
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, Callable, Awaitable, Union
-from uuid import UUID, uuid4
-from datetime import datetime, timedelta
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Callable, Awaitable, Protocol, Tuple, Union
+from uuid import UUID
+from datetime import timedelta
+
+from pydantic_core import to_json
 
 from .models import (
     A2AMessage,
@@ -19,10 +23,12 @@ from .models import (
     TaskStatus,
     AgentCard,
     AgentCapability,
+    BINARY_CONTENT_TYPES,
     ContentType,
     MessagePart
 )
 from .exceptions import A2AError, AgentNotFoundError, InvalidMessageError, TaskNotFoundError
+from ...utils import utcnow_coarse_aware, uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +36,45 @@ logger = logging.getLogger(__name__)
 MessageHandler = Callable[[A2AMessage], Awaitable[None]]
 TaskHandler = Callable[[Task], Awaitable[Task]]
 
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string; UUIDs, enums and datetimes are encoded natively."""
+    return to_json(obj).decode()
+
+# Statuses after which a task will not change again
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+# Enum members are singletons; validated messages always carry the member itself
+_MT_TASK = MessageType.TASK
+_MT_STATUS = MessageType.STATUS_UPDATE
+
+class BlobStore(Protocol):
+    """Storage shared with the recipients, used to send binary parts by reference."""
+    
+    async def put(self, digest: str, data: bytes) -> str:
+        """Store content under its SHA-256 digest and return a reference to it."""
+        ...
+    
+    async def get(self, ref: str) -> bytes:
+        """Fetch content by a reference returned from put."""
+        ...
+
 class A2AService:
     """Core service for A2A protocol implementation."""
     
-    def __init__(self, agent_id: str, agent_name: str, agent_description: str):
+    def __init__(
+        self,
+        agent_id: str,
+        agent_name: str,
+        agent_description: str,
+        blob_store: Optional[BlobStore] = None
+    ):
         """Initialize the A2A service.
         
         Args:
             agent_id: Unique identifier for this agent
             agent_name: Human-readable name of the agent
             agent_description: Description of the agent's purpose
+            blob_store: Shared storage for binary parts; without one they are sent inline
         """
         self.agent_id = agent_id
         self.agent_name = agent_name
@@ -47,12 +82,36 @@ class A2AService:
         
         # Agent capabilities and handlers
         self.capabilities: Dict[str, AgentCapability] = {}
-        self.message_handlers: Dict[MessageType, List[MessageHandler]] = {}
+        self._agent_card_json: Optional[str] = None
+        # One slot per MessageType, addressed by the member's _index
+        self.message_handlers: List[Tuple[MessageHandler, ...]] = [() for _ in MessageType]
         self.task_handlers: Dict[str, TaskHandler] = {}
         
         # Active tasks and conversations
         self.active_tasks: Dict[UUID, Task] = {}
-        self.conversations: Dict[UUID, List[A2AMessage]] = {}
+        self.conversations: "OrderedDict[UUID, Deque[A2AMessage]]" = OrderedDict()
+        
+        # Limits that keep long-lived agents from growing without bound
+        self._max_conversations = 10_000
+        self._msgs_per_conv = 1000
+        self._task_ttl = 300.0
+        
+        # Binary part payloads are sent by reference only through a shared store
+        self.blob_store = blob_store
+        
+        # Futures resolved when a task awaited by execute_task finishes
+        self._task_waiters: Dict[UUID, asyncio.Future] = {}
+        
+        # Outbound messages are queued per recipient and delivered in batches
+        self.send_batch_enabled = True
+        self._flush_interval = 0.01
+        self._outbox: Dict[str, asyncio.Queue] = {}
+        self._flushers: Dict[str, asyncio.Task] = {}
+        
+        # Send records are buffered (oldest dropped when full) and logged in batches
+        self._telemetry: Deque[Tuple[str, MessageType]] = deque(maxlen=4096)
+        self._telemetry_interval = 1.0
+        self._telemetry_drainer: Optional[asyncio.Task] = None
         
         # Agent registry (in a real implementation, this would be a separate service)
         self.known_agents: Dict[str, AgentCard] = {}
@@ -79,7 +138,7 @@ class A2AService:
             parts=[
                 MessagePart(
                     content_type=ContentType.JSON,
-                    content=json.dumps(self.get_agent_card().dict())
+                    content=self.get_agent_card_json()
                 )
             ],
             conversation_id=message.conversation_id
@@ -90,15 +149,27 @@ class A2AService:
         if not message.task:
             raise InvalidMessageError("Status update message must include a task")
         
-        task_id = message.task.task_id
-        if task_id in self.active_tasks:
-            self.active_tasks[task_id].status = message.task.status
-            self.active_tasks[task_id].updated_at = datetime.utcnow()
+        task = self.active_tasks.get(message.task.task_id)
+        if task is not None:
+            task.status = message.task.status
+            task.updated_at = utcnow_coarse_aware()
             
             if message.task.result:
-                self.active_tasks[task_id].result = message.task.result
+                task.result = message.task.result
             if message.task.error:
-                self.active_tasks[task_id].error = message.task.error
+                task.error = message.task.error
+            
+            self._on_task_update(task)
+    
+    def _on_task_update(self, task: Task) -> None:
+        """Wake up waiters and schedule eviction once a task reaches a terminal status."""
+        if task.status in _TERMINAL_STATUSES:
+            waiter = self._task_waiters.get(task.task_id)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(task)
+            asyncio.get_running_loop().call_later(
+                self._task_ttl, self.active_tasks.pop, task.task_id, None
+            )
     
     def get_agent_card(self) -> AgentCard:
         """Get this agent's capability card."""
@@ -109,6 +180,15 @@ class A2AService:
             capabilities=list(self.capabilities.values())
         )
     
+    def get_agent_card_json(self) -> str:
+        """Get this agent's capability card serialized as JSON.
+        
+        The result is cached until the next call to register_capability.
+        """
+        if self._agent_card_json is None:
+            self._agent_card_json = self.get_agent_card().model_dump_json()
+        return self._agent_card_json
+    
     def register_capability(
         self,
         name: str,
@@ -126,6 +206,7 @@ class A2AService:
             output_schema: JSON Schema for output data
             metadata: Additional metadata about the capability
         """
+        self._agent_card_json = None
         self.capabilities[name] = AgentCapability(
             name=name,
             description=description,
@@ -145,9 +226,10 @@ class A2AService:
             message_type: Type of message to handle
             handler: Async function that processes the message
         """
-        if message_type not in self.message_handlers:
-            self.message_handlers[message_type] = []
-        self.message_handlers[message_type].append(handler)
+        # Handlers are registered rarely and dispatched per message, so keep
+        # them in an immutable tuple rebuilt on registration
+        index = MessageType(message_type)._index
+        self.message_handlers[index] = self.message_handlers[index] + (handler,)
     
     def register_task_handler(
         self,
@@ -178,23 +260,52 @@ class A2AService:
             except Exception as e:
                 raise InvalidMessageError(f"Invalid message format: {str(e)}")
         
-        # Store the message in the conversation history
-        if message.conversation_id not in self.conversations:
-            self.conversations[message.conversation_id] = []
-        self.conversations[message.conversation_id].append(message)
+        # Store the message in the conversation history, evicting the least
+        # recently active conversation when over the limit
+        history = self.conversations.get(message.conversation_id)
+        if history is None:
+            history = self.conversations[message.conversation_id] = deque(maxlen=self._msgs_per_conv)
+            if len(self.conversations) > self._max_conversations:
+                self.conversations.popitem(last=False)
+        else:
+            self.conversations.move_to_end(message.conversation_id)
+        history.append(message)
         
-        # Handle the message based on its type
-        if message.message_type in self.message_handlers:
-            for handler in self.message_handlers[message.message_type]:
-                try:
-                    await handler(message)
-                except Exception as e:
-                    logger.error(f"Error in message handler: {str(e)}", exc_info=True)
+        # Handle the message based on its type; independent handlers run concurrently
+        handlers = self.message_handlers[message.message_type._index]
+        if len(handlers) == 1:
+            try:
+                await handlers[0](message)
+            except Exception as e:
+                logger.error(f"Error in message handler: {str(e)}", exc_info=True)
+        elif handlers:
+            results = await asyncio.gather(*(handler(message) for handler in handlers), return_exceptions=True)
+            for handler, result in zip(handlers, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error in message handler {handler.__qualname__}: {str(result)}",
+                        exc_info=result
+                    )
         
         # If this is a task message, handle the task
-        if message.task and message.message_type == MessageType.TASK:
+        if message.task and message.message_type is _MT_TASK:
             await self._handle_task(message)
     
+    def get_recent_messages(self, conversation_id: UUID, n: int) -> List[A2AMessage]:
+        """Get the most recent messages of a conversation, newest first.
+        
+        Args:
+            conversation_id: ID of the conversation
+            n: Maximum number of messages to return
+            
+        Returns:
+            Up to n messages, or an empty list for an unknown conversation
+        """
+        history = self.conversations.get(conversation_id)
+        if not history:
+            return []
+        return list(islice(reversed(history), n))
+    
     async def _handle_task(self, message: A2AMessage) -> None:
         """Handle an incoming task message."""
         if not message.task:
@@ -203,27 +314,25 @@ class A2AService:
         task = message.task
         self.active_tasks[task.task_id] = task
         
-        # Find a handler for this task
+        # Find a handler for this task; the key intersection walks the smaller side
         handler = None
-        for capability_name in self.capabilities:
-            if capability_name in task.parameters:
-                handler = self.task_handlers.get(capability_name)
-                if handler:
-                    break
+        for capability_name in task.parameters.keys() & self.task_handlers.keys():
+            handler = self.task_handlers[capability_name]
+            task.metadata["matched_capability"] = capability_name
+            break
         
         if not handler:
             # No handler found for this task
             task.status = TaskStatus.FAILED
             task.error = {"error": "No suitable handler found for this task"}
-            task.updated_at = datetime.utcnow()
+            task.updated_at = utcnow_coarse_aware()
+            self._on_task_update(task)
             return
         
+        # Status, result, error and updated_at are applied by send_status_update,
+        # which stamps each transition exactly once
         try:
-            # Update task status to in progress
-            task.status = TaskStatus.IN_PROGRESS
-            task.updated_at = datetime.utcnow()
-            
-            # Send status update
+            # Mark the task in progress and notify the sender
             await self.send_status_update(
                 task_id=task.task_id,
                 status=TaskStatus.IN_PROGRESS,
@@ -234,31 +343,21 @@ class A2AService:
             # Execute the task
             result = await handler(task)
             
-            # Update task with result
-            task.status = TaskStatus.COMPLETED
-            task.result = result.dict() if hasattr(result, 'dict') else result
-            task.updated_at = datetime.utcnow()
-            
-            # Send completion status
+            # Complete the task with its result
             await self.send_status_update(
                 task_id=task.task_id,
                 status=TaskStatus.COMPLETED,
-                result=task.result,
+                result=result.dict() if hasattr(result, 'dict') else result,
                 recipient_id=message.sender_id,
                 conversation_id=message.conversation_id
             )
             
         except Exception as e:
-            # Handle task execution error
-            task.status = TaskStatus.FAILED
-            task.error = {"error": str(e), "type": e.__class__.__name__}
-            task.updated_at = datetime.utcnow()
-            
-            # Send error status
+            # Fail the task with the error details
             await self.send_status_update(
                 task_id=task.task_id,
                 status=TaskStatus.FAILED,
-                error=task.error,
+                error={"error": str(e), "type": e.__class__.__name__},
                 recipient_id=message.sender_id,
                 conversation_id=message.conversation_id
             )
@@ -290,22 +389,129 @@ class A2AService:
         Note: In a real implementation, this would send the message over the network
         to the recipient agent. This is a simplified version that just logs the message.
         """
-        message = A2AMessage(
+        # Every other field is produced locally, so skip validation; the type
+        # comes from the caller and may be a plain string
+        message_type = MessageType(message_type)
+        message = A2AMessage.internal(
             message_type=message_type,
             sender_id=self.agent_id,
             recipient_id=recipient_id,
-            parts=parts,
+            parts=[await self._externalize_part(part) for part in parts],
             task=task,
             metadata=metadata or {},
-            conversation_id=conversation_id or uuid4()
+            conversation_id=conversation_id or uuid7()
         )
         
-        # In a real implementation, we would send this message over the network
-        logger.info(f"Sending message to {recipient_id}: {message_type}")
-        logger.debug(f"Message details: {message.json(indent=2)}")
+        self._telemetry.append((recipient_id, message_type))
+        drainer = self._telemetry_drainer
+        # done() covers a drainer cancelled before it ever ran its finally block
+        if drainer is None or drainer.done():
+            self._telemetry_drainer = asyncio.create_task(self._drain_telemetry())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Message details: {message.model_dump_json(indent=2)}")
+        
+        if not self.send_batch_enabled:
+            await self._send_batch(recipient_id, [message])
+            return message
+        
+        # Queue the message; a per-recipient flusher delivers it with its neighbours
+        queue = self._outbox.get(recipient_id)
+        if queue is None:
+            queue = self._outbox[recipient_id] = asyncio.Queue()
+        queue.put_nowait(message)
+        if recipient_id not in self._flushers:
+            self._flushers[recipient_id] = asyncio.create_task(self._flusher(recipient_id))
         
         return message
     
+    async def _externalize_part(self, part: MessagePart) -> MessagePart:
+        """Move a binary payload into the blob store, leaving a reference to it."""
+        if (
+            self.blob_store is None
+            or part.content_type not in BINARY_CONTENT_TYPES
+            or not isinstance(part.content, (bytes, memoryview))
+        ):
+            return part
+        
+        data = bytes(part.content)
+        digest = hashlib.sha256(data).hexdigest()
+        ref = await self.blob_store.put(digest, data)
+        return part.model_copy(update={"content": None, "content_ref": ref, "content_sha256": digest})
+    
+    async def get_part_content(self, part: MessagePart) -> Union[str, bytes, Dict[str, Any]]:
+        """Get a part's content, fetching out-of-band bytes only when needed.
+        
+        Args:
+            part: The message part
+            
+        Returns:
+            The inline content, or the referenced bytes
+        """
+        if part.content is not None or part.content_ref is None:
+            return part.content
+        if self.blob_store is None:
+            raise InvalidMessageError(f"No blob store to fetch content {part.content_ref}")
+        return await self.blob_store.get(part.content_ref)
+    
+    async def _flusher(self, recipient_id: str) -> None:
+        """Deliver queued messages for a recipient until its outbox runs dry."""
+        queue = self._outbox[recipient_id]
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            
+            batch: List[A2AMessage] = []
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            if not batch:
+                # Nothing arrived during the interval; stop until the next send
+                del self._flushers[recipient_id]
+                return
+            
+            try:
+                await self._send_batch(recipient_id, batch)
+            except Exception as e:
+                logger.error(f"Error delivering messages to {recipient_id}: {str(e)}", exc_info=True)
+    
+    async def _drain_telemetry(self) -> None:
+        """Log buffered send records as one summary line per interval."""
+        try:
+            while True:
+                await asyncio.sleep(self._telemetry_interval)
+                
+                if not self._telemetry:
+                    # Nothing was sent during the interval; stop until the next send
+                    return
+                
+                records = []
+                while self._telemetry:
+                    records.append(self._telemetry.popleft())
+                counts = Counter(records)
+                logger.info(
+                    "Sent %d message(s): %s",
+                    len(records),
+                    ", ".join(f"{count}x {message_type.value} to {recipient}" for (recipient, message_type), count in counts.items())
+                )
+        finally:
+            # Also cleared on error or cancellation, so the next send starts a new drainer
+            self._telemetry_drainer = None
+    
+    async def _send_batch(self, recipient_id: str, batch: List[A2AMessage]) -> None:
+        """Deliver a batch of messages to a recipient in a single call.
+        
+        Note: In a real implementation, this would send the batch over the network
+        to the recipient agent. This is a simplified version that just logs it.
+        """
+        logger.debug(f"Delivering {len(batch)} message(s) to {recipient_id}")
+    
+    async def flush(self) -> None:
+        """Wait until every queued outbound message has been delivered."""
+        while self._flushers:
+            await asyncio.gather(*list(self._flushers.values()))
+    
     async def send_status_update(
         self,
         task_id: UUID,
@@ -331,23 +537,25 @@ class A2AService:
         
         # Update task status
         task.status = status
-        task.updated_at = datetime.utcnow()
+        task.updated_at = utcnow_coarse_aware()
         
         if result is not None:
             task.result = result
         if error is not None:
             task.error = error
         
+        self._on_task_update(task)
+        
         # Send status update message
         await self.send_message(
             recipient_id=recipient_id,
-            message_type=MessageType.STATUS_UPDATE,
+            message_type=_MT_STATUS,
             parts=[
                 MessagePart(
                     content_type=ContentType.JSON,
-                    content=json.dumps({
-                        "task_id": str(task_id),
-                        "status": status.value,
+                    content=_dumps({
+                        "task_id": task_id,
+                        "status": status,
                         "result": result,
                         "error": error
                     })
@@ -388,34 +596,35 @@ class A2AService:
             metadata={"requested_capability": capability_name}
         )
         
-        # Send task message
-        message = await self.send_message(
-            recipient_id=recipient_id,
-            message_type=MessageType.TASK,
-            parts=[
-                MessagePart(
-                    content_type=ContentType.JSON,
-                    content=json.dumps({"capability": capability_name})
-                )
-            ],
-            task=task
-        )
+        # Track the task so incoming status updates are applied to it
+        self.active_tasks[task.task_id] = task
+        waiter = asyncio.get_running_loop().create_future()
+        self._task_waiters[task.task_id] = waiter
         
-        # Wait for task completion
-        start_time = datetime.utcnow()
-        while True:
-            # Check for timeout
-            if (datetime.utcnow() - start_time).total_seconds() > timeout:
-                task.status = TaskStatus.FAILED
-                task.error = {"error": "Task timed out"}
-                task.updated_at = datetime.utcnow()
-                raise TimeoutError(f"Task {task.task_id} timed out after {timeout} seconds")
+        try:
+            # Send task message
+            await self.send_message(
+                recipient_id=recipient_id,
+                message_type=MessageType.TASK,
+                parts=[
+                    MessagePart(
+                        content_type=ContentType.JSON,
+                        content=_dumps({"capability": capability_name})
+                    )
+                ],
+                task=task
+            )
             
-            # Check task status
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                break
-                
-            # Wait before checking again
-            await asyncio.sleep(0.1)
+            # Wait for a terminal status update to resolve the task
+            if task.status not in _TERMINAL_STATUSES:
+                await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            task.status = TaskStatus.FAILED
+            task.error = {"error": "Task timed out"}
+            task.updated_at = utcnow_coarse_aware()
+            self._on_task_update(task)
+            raise TimeoutError(f"Task {task.task_id} timed out after {timeout} seconds")
+        finally:
+            self._task_waiters.pop(task.task_id, None)
         
         return task
@@ -79,9 +79,10 @@ class AIConfig(BaseModelWithTimestamps):
     
     def update_behavior(self, **updates) -> None:
         """Update the AI's behavior configuration."""
+        validate = self.__pydantic_validator__.validate_assignment
         for key, value in updates.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+            if key in type(self).model_fields:
+                validate(self, key, value)
         self.updated_at = datetime.utcnow()
 
 class AIProfile(BaseModelWithTimestamps):
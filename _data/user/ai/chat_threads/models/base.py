@@ -4,8 +4,10 @@ Base models for AI chat threads.
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any, Literal
-from pydantic import BaseModel, Field, HttpUrl, field_validator
-from uuid import UUID, uuid4
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from uuid import UUID
+
+from ....utils import utcnow_coarse, uuid7
 
 class MessageType(str, Enum):
     """Types of messages in a chat thread."""
@@ -35,20 +37,21 @@ class ParticipantRole(str, Enum):
 
 class BaseModelWithTimestamps(BaseModel):
     """Base model with common timestamp fields."""
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier")
+    id: UUID = Field(default_factory=uuid7, description="Unique identifier")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-            UUID: lambda v: str(v) if v else None
-        }
-        use_enum_values = True
-        validate_assignment = True
+    # datetime and UUID already serialize to isoformat/str natively, so no
+    # json_encoders: those ran a Python callback for every value on dump
+    model_config = ConfigDict(
+        use_enum_values=True,
+        # Assignments are trusted; services validate outside input in BaseService.update
+        validate_assignment=False,
+    )
 
     def model_post_init(self, __context):
-        """Update timestamps on model initialization."""
-        self.updated_at = datetime.utcnow()
+        """Stamp updated_at on models constructed without one."""
+        if self.updated_at is None:
+            self.updated_at = utcnow_coarse()
         return super().model_post_init(__context)
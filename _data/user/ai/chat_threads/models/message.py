@@ -3,23 +3,38 @@ Message models for AI chat threads.
 """
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from pydantic import Field, HttpUrl, field_validator
+from pydantic import Field, HttpUrl, TypeAdapter, field_validator
 from uuid import UUID
 
+from ....utils import HttpUrlStr
 from .base import BaseModelWithTimestamps, MessageType, MessageStatus
 
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
 class Attachment(BaseModelWithTimestamps):
     """Represents a file or media attachment in a message."""
-    url: HttpUrl = Field(..., description="URL to the attached file")
+    url: HttpUrlStr = Field(..., description="URL to the attached file")
     name: str = Field(..., description="Original filename")
     mime_type: str = Field(..., description="MIME type of the file")
     size: int = Field(..., description="File size in bytes")
     width: Optional[int] = Field(None, description="Width in pixels (for images/videos)")
     height: Optional[int] = Field(None, description="Height in pixels (for images/videos)")
     duration: Optional[float] = Field(None, description="Duration in seconds (for audio/video)")
-    thumbnail_url: Optional[HttpUrl] = Field(None, description="URL to a thumbnail preview")
+    thumbnail_url: Optional[HttpUrlStr] = Field(None, description="URL to a thumbnail preview")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @property
+    def url_parsed(self) -> HttpUrl:
+        """Fully parsed and validated form of ``url``."""
+        return _HTTP_URL_ADAPTER.validate_python(self.url)
+
+    @property
+    def thumbnail_url_parsed(self) -> Optional[HttpUrl]:
+        """Fully parsed and validated form of ``thumbnail_url``, if set."""
+        if self.thumbnail_url is None:
+            return None
+        return _HTTP_URL_ADAPTER.validate_python(self.thumbnail_url)
+
 class MessageContent(BaseModelWithTimestamps):
     """Base class for message content."""
     text: Optional[str] = Field(None, description="Text content of the message")
@@ -52,7 +67,8 @@ class Message(BaseModelWithTimestamps):
 
     def update_status(self, status: MessageStatus) -> None:
         """Update the message status."""
-        self.status = status
+        # Assignment isn't validated; store the value, as use_enum_values does
+        self.status = MessageStatus(status).value
         self.updated_at = datetime.utcnow()
 
 class MessageUpdate(BaseModelWithTimestamps):
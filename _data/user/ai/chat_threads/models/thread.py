@@ -1,13 +1,25 @@
 """
 Thread and participant models for AI chat.
 """
+import os
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from pydantic import Field, field_validator
-from uuid import UUID, uuid4
+from typing import Deque, Dict, List, Optional, Any
+from pydantic import Field, PrivateAttr, field_validator, model_validator
+from uuid import UUID
 
 from .base import BaseModelWithTimestamps, ParticipantRole
 
+# Short random ids for default display names, generated 256 at a time
+_short_ids: Deque[str] = deque()
+
+def _next_short_id() -> str:
+    """Get an 8-character hex id from the pool, refilling it when empty."""
+    if not _short_ids:
+        raw = os.urandom(4 * 256).hex()
+        _short_ids.extend(raw[i:i + 8] for i in range(0, len(raw), 8))
+    return _short_ids.popleft()
+
 class Participant(BaseModelWithTimestamps):
     """Represents a participant in a chat thread."""
     thread_id: UUID = Field(..., description="ID of the thread")
@@ -22,7 +34,7 @@ class Participant(BaseModelWithTimestamps):
     @field_validator('display_name')
     def set_display_name(cls, v):
         """Set a default display name if none provided."""
-        return v or f"User {str(uuid4())[:8]}"
+        return v or f"User {_next_short_id()}"
 
 class ThreadSettings(BaseModelWithTimestamps):
     """Configuration settings for a chat thread."""
@@ -52,10 +64,26 @@ class Thread(BaseModelWithTimestamps):
     participants: List[Participant] = Field(default_factory=list, description="Thread participants")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    # user_id -> Participant, kept in step by the participant methods (not serialized)
+    _participants_by_uid: Dict[UUID, Participant] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode='after')
+    def index_participants(self) -> 'Thread':
+        """Build the participant index from the validated list."""
+        self._participants_by_uid = {p.user_id: p for p in self.participants}
+        return self
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'Thread':
+        # model_copy(deep=True) copies fields and private attrs separately, so
+        # the copied index would point at the original participants
+        copied = super().__deepcopy__(memo)
+        copied.index_participants()
+        return copied
+
     def add_participant(self, user_id: UUID, role: ParticipantRole = ParticipantRole.USER, **kwargs) -> Participant:
         """Add a participant to the thread."""
         # Check if user is already a participant
-        if any(p.user_id == user_id for p in self.participants):
+        if user_id in self._participants_by_uid:
             raise ValueError(f"User {user_id} is already a participant in this thread")
         
         participant = Participant(
@@ -65,31 +93,30 @@ class Thread(BaseModelWithTimestamps):
             **kwargs
         )
         self.participants.append(participant)
+        self._participants_by_uid[user_id] = participant
         self.updated_at = datetime.utcnow()
         return participant
 
     def remove_participant(self, user_id: UUID) -> bool:
         """Remove a participant from the thread."""
-        initial_count = len(self.participants)
-        self.participants = [p for p in self.participants if p.user_id != user_id]
-        if len(self.participants) < initial_count:
-            self.updated_at = datetime.utcnow()
-            return True
-        return False
+        participant = self._participants_by_uid.pop(user_id, None)
+        if participant is None:
+            return False
+        self.participants.remove(participant)
+        self.updated_at = datetime.utcnow()
+        return True
 
     def update_participant_role(self, user_id: UUID, role: ParticipantRole) -> bool:
         """Update a participant's role in the thread."""
-        for participant in self.participants:
-            if participant.user_id == user_id:
-                participant.role = role
-                participant.updated_at = datetime.utcnow()
-                self.updated_at = datetime.utcnow()
-                return True
-        return False
+        participant = self._participants_by_uid.get(user_id)
+        if participant is None:
+            return False
+        # Assignment isn't validated; store the value, as use_enum_values does
+        participant.role = ParticipantRole(role).value
+        participant.updated_at = datetime.utcnow()
+        self.updated_at = datetime.utcnow()
+        return True
 
     def get_participant(self, user_id: UUID) -> Optional[Participant]:
         """Get a participant by user ID."""
-        for participant in self.participants:
-            if participant.user_id == user_id:
-                return participant
-        return None
+        return self._participants_by_uid.get(user_id)
@@ -2,9 +2,10 @@
 Base service classes for AI chat threads.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, FrozenSet, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
+from ....utils import utcnow_coarse
 from ..models import BaseModelWithTimestamps
 
 T = TypeVar('T', bound=BaseModelWithTimestamps)
@@ -12,38 +13,123 @@ T = TypeVar('T', bound=BaseModelWithTimestamps)
 class BaseService(ABC, Generic[T]):
     """Base service class with common CRUD operations."""
     
+    # Fields with a hash index, for the filters a subclass uses most. The
+    # postings follow create/update/modify/delete and only narrow the
+    # candidates; every filter is re-checked on the item, so a direct
+    # assignment can never add a wrong item to the results. It can hide one
+    # until the item next goes through update or modify.
+    _indexed_fields: Tuple[str, ...] = ()
+    # Fields whose combined values identify at most one item
+    _unique_together: Tuple[str, ...] = ()
+    # Fields a dict passed to update() may set; defaults to every field but id
+    # and created_at
+    _writable_fields: Optional[FrozenSet[str]] = None
+    
     def __init__(self, model_class: Type[T]):
         self.model_class = model_class
+        if self._writable_fields is None:
+            self._writable_fields = frozenset(model_class.model_fields) - {'id', 'created_at'}
         self._storage: Dict[UUID, T] = {}
+        
+        # field -> value -> ids (a dict used as an insertion-ordered set)
+        self._indexes: Dict[str, Dict[Any, Dict[UUID, None]]] = {
+            field: {} for field in self._indexed_fields
+        }
+        # id -> the values the item is currently indexed under
+        self._indexed_values: Dict[UUID, Tuple[Any, ...]] = {}
+        # _unique_together values -> id, and the reverse
+        self._by_unique_key: Dict[Tuple[Any, ...], UUID] = {}
+        self._unique_keys: Dict[UUID, Tuple[Any, ...]] = {}
+    
+    def _index(self, item: T) -> None:
+        """Add an item to the field indexes."""
+        if self._unique_together:
+            key = tuple(getattr(item, field) for field in self._unique_together)
+            self._by_unique_key[key] = item.id
+            self._unique_keys[item.id] = key
+        if not self._indexes:
+            return
+        values = tuple(getattr(item, field) for field in self._indexed_fields)
+        self._indexed_values[item.id] = values
+        for field, value in zip(self._indexed_fields, values):
+            self._indexes[field].setdefault(value, {})[item.id] = None
+    
+    def _unindex(self, id: UUID) -> None:
+        """Remove an item from the field indexes."""
+        key = self._unique_keys.pop(id, None)
+        if key is not None and self._by_unique_key.get(key) == id:
+            del self._by_unique_key[key]
+        values = self._indexed_values.pop(id, None)
+        if values is None:
+            return
+        for field, value in zip(self._indexed_fields, values):
+            postings = self._indexes[field][value]
+            del postings[id]
+            if not postings:
+                del self._indexes[field][value]
+    
+    def _matching(self, filters: Dict[str, Any]) -> Iterator[T]:
+        """Iterate stored items that match every filter.
+        
+        Indexed filters pick the candidates; every filter is then checked on
+        the item itself, since the models don't stop direct assignment.
+        """
+        postings = [
+            self._indexes[key].get(value, {})
+            for key, value in filters.items()
+            if key in self._indexes
+        ]
+        if postings:
+            # Walk the smallest posting set and probe the others
+            postings.sort(key=len)
+            smallest, others = postings[0], postings[1:]
+            candidates = (
+                self._storage[id] for id in smallest
+                if all(id in other for other in others)
+            )
+        else:
+            candidates = self._storage.values()
+        
+        for item in candidates:
+            if all(getattr(item, key) == value for key, value in filters.items()):
+                yield item
     
     async def get(self, id: UUID) -> Optional[T]:
         """Retrieve a single item by ID."""
         return self._storage.get(id)
     
+    def _get_unique(self, *values: Any) -> Optional[T]:
+        """Retrieve the item whose _unique_together fields equal values."""
+        id = self._by_unique_key.get(values)
+        return self._storage.get(id) if id is not None else None
+    
+    async def get_by(self, **filters) -> Optional[T]:
+        """Retrieve the first item matching every filter."""
+        return next(self._matching(filters), None)
+    
     async def list(self, **filters) -> List[T]:
         """List items with optional filtering."""
-        results = list(self._storage.values())
-        
-        # Apply filters
-        if filters:
-            results = [
-                item for item in results
-                if all(
-                    getattr(item, key) == value 
-                    for key, value in filters.items()
-                )
-            ]
-            
-        return results
+        if not filters:
+            return list(self._storage.values())
+        return list(self._matching(filters))
     
-    async def create(self, data: Union[Dict[str, Any], T]) -> T:
-        """Create a new item."""
+    async def create(self, data: Union[Dict[str, Any], T], trusted: bool = False) -> T:
+        """Create a new item.
+        
+        A dict from a trusted source (already typed by the calling service) is
+        stored without validation.
+        """
         if isinstance(data, dict):
-            item = self.model_class(**data)
+            if trusted:
+                item = self.model_class.model_construct(**data)
+            else:
+                item = self.model_class.model_validate(data)
         else:
             item = data
             
+        self._unindex(item.id)
         self._storage[item.id] = item
+        self._index(item)
         return item
     
     async def update(self, id: UUID, data: Union[Dict[str, Any], T]) -> Optional[T]:
@@ -52,22 +138,43 @@ class BaseService(ABC, Generic[T]):
             return None
             
         if isinstance(data, dict):
-            # Update with dictionary
+            # Update with dictionary. Models don't validate on assignment, so
+            # the values are validated here, where outside input comes in.
             item = self._storage[id]
+            validate = self.model_class.__pydantic_validator__.validate_assignment
             for key, value in data.items():
-                if hasattr(item, key):
-                    setattr(item, key, value)
+                if key in self._writable_fields:
+                    validate(item, key, value)
+            if 'updated_at' not in data:
+                item.updated_at = utcnow_coarse()
         else:
             # Replace the entire item
             self._storage[id] = data
             item = data
-            
+            item.updated_at = utcnow_coarse()
+        
+        self._unindex(id)
+        self._index(item)
         return item
     
+    async def modify(self, id: UUID, mutate: Callable[[T], Optional[T]]) -> Optional[T]:
+        """Apply an in-place change to an item as a single storage operation.
+        
+        mutate returns the changed item, or None to report that nothing applied.
+        """
+        item = self._storage.get(id)
+        if item is None:
+            return None
+        result = mutate(item)
+        self._unindex(id)
+        self._index(item)
+        return result
+    
     async def delete(self, id: UUID) -> bool:
         """Delete an item by ID."""
         if id in self._storage:
             del self._storage[id]
+            self._unindex(id)
             return True
         return False
     
@@ -77,8 +184,12 @@ class BaseService(ABC, Generic[T]):
     
     async def count(self, **filters) -> int:
         """Count items with optional filtering."""
-        items = await self.list(**filters)
-        return len(items)
+        if not filters:
+            return len(self._storage)
+        
+        # Count matches directly instead of building the filtered list; the
+        # candidates are still checked, as a posting set can be stale
+        return sum(1 for _ in self._matching(filters))
 
 
 class ThreadAwareService(BaseService[T], ABC):
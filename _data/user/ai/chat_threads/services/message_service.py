@@ -1,6 +1,9 @@
 """
 Service for managing messages in chat threads.
 """
+import asyncio
+import heapq
+import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any, cast
 from uuid import UUID, uuid4
@@ -14,16 +17,74 @@ from ..models import (
     Thread,
     ParticipantRole
 )
+from ....utils import utcnow_coarse
 from .base import ThreadAwareService
 from .thread_service import ThreadService, ParticipantService
 
+logger = logging.getLogger(__name__)
+
+# Message fields update_message may change; identity and ownership are fixed
+_MESSAGE_MUTABLE_FIELDS = frozenset(Message.model_fields) - {'id', 'thread_id', 'sender_id', 'created_at'}
+
+class ThreadTouchCoalescer:
+    """Coalesces thread updated_at writes into one per thread per interval.
+    
+    The caller stamps the thread it holds right away; only the service write
+    is deferred. Touches still pending when the event loop stops are lost
+    unless flush() is awaited first.
+    """
+    
+    def __init__(self, thread_service: ThreadService, interval: float = 0.05):
+        self._thread_service = thread_service
+        self._interval = interval
+        self._pending: Dict[UUID, datetime] = {}
+        self._flusher: Optional[asyncio.Task] = None
+    
+    def touch(self, thread_id: UUID, when: datetime) -> None:
+        """Schedule a thread's updated_at to be set; the latest time wins."""
+        current = self._pending.get(thread_id)
+        if current is None or when > current:
+            self._pending[thread_id] = when
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_later())
+            self._flusher.add_done_callback(self._log_flush_failure)
+    
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._interval)
+        self._flusher = None
+        await self.flush()
+    
+    @staticmethod
+    def _log_flush_failure(task: asyncio.Task) -> None:
+        """Log a background flush that raised, since nothing awaits it."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to write thread updated_at touches", exc_info=task.exception())
+    
+    async def flush(self) -> None:
+        """Write all pending thread touches now."""
+        pending, self._pending = self._pending, {}
+        for thread_id, when in pending.items():
+            await self._thread_service.update(thread_id, {'updated_at': when})
+
+
 class MessageService(ThreadAwareService[Message]):
     """Service for managing messages in chat threads."""
     
+    _indexed_fields = ('thread_id', 'sender_id')
+    _writable_fields = _MESSAGE_MUTABLE_FIELDS
+    
     def __init__(self, thread_service: Optional[ThreadService] = None):
         super().__init__(Message)
         self._thread_service = thread_service or ThreadService()
         self._participant_service = ParticipantService()
+        self._thread_touches = ThreadTouchCoalescer(self._thread_service)
+    
+    async def flush(self) -> None:
+        """Apply any thread updated_at writes still waiting to be made.
+        
+        Await this before shutting down; pending writes are otherwise lost.
+        """
+        await self._thread_touches.flush()
     
     async def create_message(
         self,
@@ -50,41 +111,30 @@ class MessageService(ThreadAwareService[Message]):
             if not participant:
                 return None
         
-        # Prepare message content
+        # Plain text becomes MessageContent; dicts for content and attachments
+        # are coerced by Message validation itself
         if isinstance(content, str):
-            content_data = MessageContent(text=content)
-        elif isinstance(content, dict):
-            content_data = MessageContent(**content)
-        else:
-            content_data = content
-        
-        # Prepare attachments
-        attachment_objs = []
-        if attachments:
-            for attachment in attachments:
-                if isinstance(attachment, dict):
-                    attachment_objs.append(Attachment(**attachment))
-                else:
-                    attachment_objs.append(attachment)
+            content = MessageContent(text=content)
         
         # Create the message
         message = Message(
             thread_id=thread_id,
             sender_id=sender_id,
             sender_type=sender_type,
-            content=content_data,
+            content=content,
             message_type=message_type,
             reply_to=reply_to,
-            attachments=attachment_objs,
+            attachments=attachments or [],
             metadata=metadata or {}
         )
         
         # Store the message
         created = await self.create(message)
         
-        # Update thread's updated_at timestamp
-        thread.updated_at = datetime.utcnow()
-        await self._thread_service.update(thread.id, thread)
+        # Stamp the thread now; the service writes are coalesced per burst
+        now = utcnow_coarse()
+        thread.updated_at = now
+        self._thread_touches.touch(thread.id, now)
         
         return created
     
@@ -108,13 +158,8 @@ class MessageService(ThreadAwareService[Message]):
             if not participant or participant.role not in [ParticipantRole.ADMIN, ParticipantRole.MODERATOR]:
                 return None
         
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(message, key):
-                setattr(message, key, value)
-        
-        message.updated_at = datetime.utcnow()
-        return await self.update(message_id, message)
+        # Apply updates; only _MESSAGE_MUTABLE_FIELDS are validated and written
+        return await self.update(message_id, updates)
     
     async def delete_message(
         self,
@@ -152,17 +197,14 @@ class MessageService(ThreadAwareService[Message]):
         """List messages in a thread with pagination and filtering."""
         messages = await self.list(thread_id=thread_id, **filters)
         
-        # Apply time-based filtering
-        if before:
-            messages = [m for m in messages if m.created_at < before]
-        if after:
-            messages = [m for m in messages if m.created_at > after]
-        
-        # Sort by creation time (newest first)
-        messages.sort(key=lambda m: m.created_at, reverse=True)
-        
-        # Apply limit
-        return messages[:limit]
+        # Filter by time and keep only the newest `limit` in a single pass,
+        # without sorting the whole thread
+        if before or after:
+            messages = (
+                m for m in messages
+                if (not before or m.created_at < before) and (not after or m.created_at > after)
+            )
+        return heapq.nlargest(limit, messages, key=lambda m: m.created_at)
     
     async def count_by_thread(self, thread_id: UUID, **filters) -> int:
         """Count messages in a thread with optional filtering."""
@@ -175,23 +217,14 @@ class MessageService(ThreadAwareService[Message]):
         emoji: str
     ) -> Optional[Message]:
         """Add a reaction to a message."""
-        message = await self.get(message_id)
-        if not message:
-            return None
-            
-        # Initialize reactions dict if it doesn't exist
-        if 'reactions' not in message.metadata:
-            message.metadata['reactions'] = {}
-            
-        # Initialize emoji list if it doesn't exist
-        if emoji not in message.metadata['reactions']:
-            message.metadata['reactions'][emoji] = []
-            
-        # Add user to reaction if not already there
-        if user_id not in message.metadata['reactions'][emoji]:
-            message.metadata['reactions'][emoji].append(user_id)
-            
-        return await self.update(message_id, message)
+        def add(message: Message) -> Message:
+            users = message.metadata.setdefault('reactions', {}).setdefault(emoji, [])
+            if user_id not in users:
+                users.append(user_id)
+            message.updated_at = utcnow_coarse()
+            return message
+        
+        return await self.modify(message_id, add)
     
     async def remove_reaction(
         self,
@@ -200,22 +233,22 @@ class MessageService(ThreadAwareService[Message]):
         emoji: str
     ) -> Optional[Message]:
         """Remove a reaction from a message."""
-        message = await self.get(message_id)
-        if not message or 'reactions' not in message.metadata:
-            return None
-            
-        if emoji in message.metadata['reactions']:
-            # Remove user from reaction
-            message.metadata['reactions'][emoji] = [
-                uid for uid in message.metadata['reactions'][emoji]
-                if uid != user_id
-            ]
+        def remove(message: Message) -> Optional[Message]:
+            reactions = message.metadata.get('reactions')
+            if reactions is None:
+                return None
             
-            # Remove emoji if no more reactions
-            if not message.metadata['reactions'][emoji]:
-                del message.metadata['reactions'][emoji]
-                
-        return await self.update(message_id, message)
+            if emoji in reactions:
+                # Remove user from reaction, and the emoji once nobody is left
+                users = [uid for uid in reactions[emoji] if uid != user_id]
+                if users:
+                    reactions[emoji] = users
+                else:
+                    del reactions[emoji]
+            message.updated_at = utcnow_coarse()
+            return message
+        
+        return await self.modify(message_id, remove)
 
 
 class MessageSearchService:
@@ -236,6 +269,11 @@ class MessageSearchService:
         # In a real implementation, this would use a search engine like Elasticsearch
         # For now, we'll do a simple text search in memory
         
+        # Push the sender filter down to storage so other senders' messages
+        # are never handed to the text scan
+        if user_id is not None:
+            filters['sender_id'] = user_id
+        
         # Get messages based on filters
         if thread_id:
             messages = await self._message_service.list_by_thread(thread_id, **filters)
@@ -247,10 +285,6 @@ class MessageSearchService:
         results = []
         
         for message in messages:
-            # Skip if user_id is provided and doesn't match
-            if user_id is not None and message.sender_id != user_id:
-                continue
-                
             # Search in message content
             if message.content.text and query in message.content.text.lower():
                 results.append(message)
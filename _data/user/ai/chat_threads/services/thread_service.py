@@ -1,6 +1,7 @@
 """
 Service for managing chat threads and participants.
 """
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
 from uuid import UUID, uuid4
@@ -40,34 +41,36 @@ class ThreadService(BaseService[Thread]):
             'is_public': is_public,
             **kwargs
         }
-        thread = await self.create(thread_data)
+        # Only this method's own typed arguments can skip validation
+        thread = await self.create(thread_data, trusted=not kwargs)
         
-        # Add creator as admin
-        await self._participant_service.add_participant(
-            thread_id=thread.id,
-            user_id=creator_id,
-            role=ParticipantRole.ADMIN
-        )
-        
-        # Add other participants
-        if participant_ids:
-            for user_id in participant_ids:
-                if user_id != creator_id:  # Don't add creator again
-                    await self._participant_service.add_participant(
-                        thread_id=thread.id,
-                        user_id=user_id,
-                        role=ParticipantRole.USER
-                    )
-        
-        # Add AI participants
-        if ai_profile_ids:
-            for ai_profile_id in ai_profile_ids:
-                await self._ai_participant_service.add_ai_participant(
+        # Add the creator as admin, then other participants (creator not again)
+        # and AI participants; the additions are independent, so run them together
+        await asyncio.gather(
+            self._participant_service.add_participant(
+                thread_id=thread.id,
+                user_id=creator_id,
+                role=ParticipantRole.ADMIN
+            ),
+            *(
+                self._participant_service.add_participant(
+                    thread_id=thread.id,
+                    user_id=user_id,
+                    role=ParticipantRole.USER
+                )
+                for user_id in participant_ids or []
+                if user_id != creator_id
+            ),
+            *(
+                self._ai_participant_service.add_ai_participant(
                     thread_id=thread.id,
                     ai_profile_id=ai_profile_id
                 )
+                for ai_profile_id in ai_profile_ids or []
+            )
+        )
         
-        return await self.get(thread.id)
+        return thread
     
     async def get_thread_with_participants(self, thread_id: UUID) -> Optional[Dict]:
         """Get a thread with its participants."""
@@ -78,11 +81,11 @@ class ThreadService(BaseService[Thread]):
         participants = await self._participant_service.list_by_thread(thread_id)
         ai_participants = await self._ai_participant_service.list_by_thread(thread_id)
         
-        return {
-            **thread.model_dump(),
-            'participants': [p.model_dump() for p in participants],
-            'ai_participants': [ap.model_dump() for ap in ai_participants]
-        }
+        # The embedded participants list is replaced below, so it isn't dumped
+        result = thread.model_dump(exclude={'participants'})
+        result['participants'] = [p.model_dump() for p in participants]
+        result['ai_participants'] = [ap.model_dump() for ap in ai_participants]
+        return result
     
     async def add_participant(
         self,
@@ -140,6 +143,9 @@ class ThreadService(BaseService[Thread]):
 class ParticipantService(ThreadAwareService[Participant]):
     """Service for managing thread participants."""
     
+    _indexed_fields = ('thread_id', 'user_id')
+    _unique_together = ('thread_id', 'user_id')
+    
     def __init__(self):
         super().__init__(Participant)
     
@@ -171,8 +177,7 @@ class ParticipantService(ThreadAwareService[Participant]):
         user_id: UUID
     ) -> Optional[Participant]:
         """Get a participant by thread ID and user ID."""
-        participants = await self.list(thread_id=thread_id, user_id=user_id)
-        return participants[0] if participants else None
+        return self._get_unique(thread_id, user_id)
     
     async def remove_participant(self, thread_id: UUID, user_id: UUID) -> bool:
         """Remove a participant from a thread."""
@@ -193,7 +198,8 @@ class ParticipantService(ThreadAwareService[Participant]):
         if not participant:
             return False
             
-        participant.role = role
+        # Assignment isn't validated; store the value, as use_enum_values does
+        participant.role = ParticipantRole(role).value
         await self.update(participant.id, participant)
         return True
     
@@ -209,6 +215,9 @@ class ParticipantService(ThreadAwareService[Participant]):
 class AIParticipantService(ThreadAwareService[AIThreadParticipant]):
     """Service for managing AI participants in threads."""
     
+    _indexed_fields = ('thread_id', 'ai_profile_id')
+    _unique_together = ('thread_id', 'ai_profile_id')
+    
     def __init__(self):
         super().__init__(AIThreadParticipant)
         self._ai_profile_service = AIProfileService()
@@ -244,8 +253,7 @@ class AIParticipantService(ThreadAwareService[AIThreadParticipant]):
         ai_profile_id: UUID
     ) -> Optional[AIThreadParticipant]:
         """Get an AI participant by thread ID and AI profile ID."""
-        participants = await self.list(thread_id=thread_id, ai_profile_id=ai_profile_id)
-        return participants[0] if participants else None
+        return self._get_unique(thread_id, ai_profile_id)
     
     async def remove_ai_participant(
         self,
@@ -286,6 +294,8 @@ class AIParticipantService(ThreadAwareService[AIThreadParticipant]):
 class AIProfileService(BaseService[AIProfile]):
     """Service for managing AI profiles."""
     
+    _indexed_fields = ('user_id', 'is_public')
+    
     def __init__(self):
         super().__init__(AIProfile)
     
@@ -4,9 +4,11 @@ Base models and interfaces for AI service integrations.
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationInfo, field_validator
 from datetime import datetime
 
+from ...utils import utcnow_coarse
+
 T = TypeVar('T')
 
 class StreamEventType(str, Enum):
@@ -18,30 +20,27 @@ class StreamEventType(str, Enum):
 
 class StreamEvent(BaseModel, Generic[T]):
     """Represents an event in a streaming response."""
+    model_config = ConfigDict(use_enum_values=True)
+
     event_type: StreamEventType = Field(..., description="Type of streaming event")
     data: Optional[T] = Field(None, description="Event data payload")
     error: Optional[str] = Field(None, description="Error message if event_type is ERROR")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Event timestamp")
-
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    timestamp: datetime = Field(default_factory=utcnow_coarse, description="Event timestamp")
 
 class BaseAIConfig(BaseModel, ABC):
     """Base configuration for AI services."""
     enabled: bool = Field(True, description="Whether this service is enabled")
-    api_key: Optional[str] = Field(None, description="API key for the service")
+    api_key: Optional[str] = Field(None, validate_default=True, description="API key for the service")
     model: str = Field(..., description="Default model to use")
     temperature: float = Field(0.7, ge=0.0, le=2.0, description="Sampling temperature")
     max_tokens: Optional[int] = Field(None, description="Maximum tokens to generate")
     timeout: int = Field(30, description="Request timeout in seconds")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    @validator('api_key', always=True)
-    def validate_api_key(cls, v, values):
-        if not v and values.get('enabled', False):
+    @field_validator('api_key')
+    @classmethod
+    def validate_api_key(cls, v, info: ValidationInfo):
+        if not v and info.data.get('enabled', False):
             raise ValueError("API key is required when service is enabled")
         return v
 
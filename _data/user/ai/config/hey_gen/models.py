@@ -3,9 +3,10 @@ HeyGen integration models for avatar streaming and video generation.
 """
 from typing import Dict, Optional, Any
 from enum import Enum
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 
+from ....utils import HttpUrlStr, utcnow_coarse
 from ..base_models import BaseAIConfig, StreamingConfig
 
 class AvatarStyle(str, Enum):
@@ -36,7 +37,7 @@ class HeyGenAvatarConfig(BaseModel):
     style: AvatarStyle = Field(AvatarStyle.REALISTIC, description="Visual style of the avatar")
     default_emotion: Emotion = Field(Emotion.NEUTRAL, description="Default emotion")
     position: AvatarPosition = Field(AvatarPosition.CENTER, description="Position in the frame")
-    background_url: Optional[HttpUrl] = Field(None, description="Custom background URL")
+    background_url: Optional[HttpUrlStr] = Field(None, description="Custom background URL")
     voice_id: Optional[str] = Field(None, description="Default voice ID for speech")
     lip_sync: bool = Field(True, description="Enable lip-syncing to audio")
     resolution: str = Field("1080p", description="Output resolution (e.g., 720p, 1080p, 4K)")
@@ -63,36 +64,27 @@ class HeyGenConfig(BaseAIConfig):
         description="Configured avatars"
     )
 
-    @field_validator('default_avatar_id')
-    def validate_default_avatar(cls, v, values):
-        if v and 'avatars' in values and v not in values['avatars']:
-            raise ValueError(f"Default avatar {v} not found in configured avatars")
-        return v
+    # Runs after all fields are set: avatars is declared after default_avatar_id
+    @model_validator(mode='after')
+    def validate_default_avatar(self):
+        if self.default_avatar_id and self.default_avatar_id not in self.avatars:
+            raise ValueError(f"Default avatar {self.default_avatar_id} not found in configured avatars")
+        return self
 
 class HeyGenStreamState(BaseModel):
     """State for an active HeyGen streaming session."""
     session_id: str = Field(..., description="Unique session ID")
     avatar_id: str = Field(..., description="Active avatar ID")
     voice_id: str = Field(..., description="Active voice ID")
-    start_time: datetime = Field(default_factory=datetime.utcnow, description="Session start time")
-    last_active: datetime = Field(default_factory=datetime.utcnow, description="Last activity timestamp")
+    start_time: datetime = Field(default_factory=utcnow_coarse, description="Session start time")
+    last_active: datetime = Field(default_factory=utcnow_coarse, description="Last activity timestamp")
     is_active: bool = Field(True, description="Whether the session is active")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Session metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-
 class HeyGenResponse(BaseModel):
     """Standard response from HeyGen API."""
     success: bool = Field(..., description="Whether the request was successful")
     data: Optional[Dict[str, Any]] = Field(None, description="Response data")
     error: Optional[str] = Field(None, description="Error message if any")
     request_id: Optional[str] = Field(None, description="Unique request ID for support")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    timestamp: datetime = Field(default_factory=utcnow_coarse, description="Response timestamp")
@@ -3,7 +3,7 @@ OpenRouter integration models for text generation.
 """
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 from datetime import datetime
 
 from ..base_models import BaseAIConfig, StreamingConfig
@@ -69,11 +69,12 @@ class OpenRouterConfig(BaseAIConfig):
         description="Additional HTTP headers to include in requests"
     )
 
-    @field_validator('default_model')
-    def validate_default_model(cls, v, values):
-        if v and 'models' in values and v not in values['models']:
-            raise ValueError(f"Default model {v} not found in configured models")
-        return v
+    # Runs after all fields are set: models is declared after default_model
+    @model_validator(mode='after')
+    def validate_default_model(self):
+        if self.default_model and self.default_model not in self.models:
+            raise ValueError(f"Default model {self.default_model} not found in configured models")
+        return self
 
 class TextGenerationRequest(BaseModel):
     """Request for text generation."""
@@ -98,11 +99,6 @@ class TextGenerationResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Generation timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-
 class TextStreamChunk(BaseModel):
     """A chunk of streaming text generation."""
     text: str = Field(..., description="Generated text chunk")
@@ -3,7 +3,7 @@ Vapi.ai integration models for voice interfaces.
 """
 from enum import Enum
 from typing import Dict, Optional,Any
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, field_serializer, model_validator
 from datetime import datetime
 
 from ..base_models import BaseAIConfig, StreamingConfig
@@ -78,11 +78,12 @@ class VapiConfig(BaseAIConfig):
     echo_cancellation: bool = Field(True, description="Enable echo cancellation")
     auto_gain_control: bool = Field(True, description="Enable auto gain control")
 
-    @field_validator('default_voice_id')
-    def validate_default_voice(cls, v, values):
-        if v and 'voices' in values and v not in values['voices']:
-            raise ValueError(f"Default voice {v} not found in configured voices")
-        return v
+    # Runs after all fields are set: voices is declared after default_voice_id
+    @model_validator(mode='after')
+    def validate_default_voice(self):
+        if self.default_voice_id and self.default_voice_id not in self.voices:
+            raise ValueError(f"Default voice {self.default_voice_id} not found in configured voices")
+        return self
 
 class VoiceRequest(BaseModel):
     """Request for voice synthesis or recognition."""
@@ -105,11 +106,10 @@ class VoiceResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-            bytes: lambda v: "<binary data>" if v else None
-        }
+    # Datetimes are serialized natively; only raw audio needs a placeholder
+    @field_serializer('audio_data', when_used='json')
+    def serialize_audio_data(self, v: Optional[bytes]) -> Optional[str]:
+        return "<binary data>" if v else None
 
 class VoiceStreamChunk(BaseModel):
     """A chunk of streaming audio data."""
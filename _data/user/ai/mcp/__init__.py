@@ -6,6 +6,8 @@ using a standardized protocol. It includes tools for registering and executing o
 handling requests and responses, and managing context.
 """
 from .models import (
+    MCPBatchRequest,
+    MCPBatchResponse,
     MCPRequest,
     MCPResponse,
     MCPResult,
@@ -29,6 +31,8 @@ from .router import router, register_mcp_routes
 
 __all__ = [
     # Models
+    'MCPBatchRequest',
+    'MCPBatchResponse',
     'MCPRequest',
     'MCPResponse',
     'MCPResult',
@@ -1,7 +1,7 @@
 """
 Decorators for MCP (Model Context Protocol) tools.
 """
-from typing import Any, Callable, Dict, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, FrozenSet, Optional, TypeVar, cast
 from functools import wraps
 from .models import MCPTool, MCPToolRegistry
 
@@ -41,14 +41,9 @@ def tool(
             required=required or []
         )
         
-        # Register the tool with the registry
-        MCPToolRegistry.register(tool)(func)
-        
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **kwargs)
-            
-        return cast(F, wrapper)
+        # Register the tool with the registry; the function is returned unwrapped
+        # so calls don't pay for an extra coroutine frame
+        return MCPToolRegistry.register(tool)(func)
     return decorator
 
 
@@ -57,17 +52,27 @@ def validate_parameters(func: F) -> F:
     """
     Decorator to validate function parameters against the tool's schema.
     """
+    # Required names are snapshotted per registered tool, so each call is a
+    # single set difference instead of a loop over tool.required
+    resolved: Optional[MCPTool] = None
+    required: FrozenSet[str] = frozenset()
+    
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal resolved, required
+        
         # Get the tool from the registry
         tool = MCPToolRegistry.get_tool(func.__name__)
         if not tool:
             raise ValueError(f"Tool '{func.__name__}' not found in registry")
+        if tool is not resolved:
+            resolved, required = tool, frozenset(tool.required)
             
         # Validate required parameters
-        for param in tool.required:
-            if param not in kwargs:
-                raise ValueError(f"Missing required parameter: {param}")
+        missing = required.difference(kwargs)
+        if missing:
+            param = next(p for p in tool.required if p in missing)
+            raise ValueError(f"Missing required parameter: {param}")
                 
         # TODO: Add more comprehensive parameter validation
         # based on the tool.parameters schema
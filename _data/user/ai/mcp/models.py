@@ -1,12 +1,18 @@
 """
 MCP (Model Context Protocol) data models for AI operations.
 """
+import inspect
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Callable
-from pydantic import BaseModel, Field, validator
-from uuid import UUID, uuid4
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Type, TypeVar, Generic, Callable, Union
+from pydantic import (
+    BaseModel, ConfigDict, Field, PrivateAttr, StrictFloat, StrictInt, create_model, model_validator
+)
+from uuid import UUID
 from datetime import datetime
 
+from ...utils import utcnow_coarse, uuid7
+
 
 class MCPStatus(str, Enum):
     """Status of an MCP operation."""
@@ -26,11 +32,11 @@ class MCPResult(BaseModel):
 
 class MCPRequest(BaseModel):
     """Base request model for MCP operations."""
-    request_id: UUID = Field(default_factory=uuid4, description="Unique request ID")
+    request_id: UUID = Field(default_factory=uuid7, description="Unique request ID")
     operation: str = Field(..., description="Name of the operation to perform")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Operation parameters")
     context: Dict[str, Any] = Field(default_factory=dict, description="Contextual information")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow_coarse, description="Creation timestamp")
 
 
 class MCPResponse(BaseModel):
@@ -41,11 +47,61 @@ class MCPResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
 
-    @validator('status')
-    def set_completed_at(cls, v, values):
-        if v in [MCPStatus.COMPLETED, MCPStatus.FAILED]:
-            values['completed_at'] = datetime.utcnow()
-        return v
+    @model_validator(mode='after')
+    def set_completed_at(self):
+        if self.completed_at is None and self.status in (MCPStatus.COMPLETED, MCPStatus.FAILED):
+            self.completed_at = utcnow_coarse()
+        return self
+
+
+class MCPBatchRequest(BaseModel):
+    """Several independent MCP operations submitted together."""
+    batch_id: UUID = Field(default_factory=uuid7, description="Unique batch ID")
+    operations: List[MCPRequest] = Field(..., description="Operations to run concurrently")
+
+
+class MCPBatchResponse(BaseModel):
+    """Responses to a batch of MCP operations, in submission order."""
+    batch_id: UUID = Field(..., description="Corresponding batch ID")
+    responses: List[MCPResponse] = Field(default_factory=list, description="One response per operation")
+
+
+# Python types for the JSON Schema primitive types tool parameters may declare;
+# a "number" keeps an integer argument an int, as JSON Schema allows
+_JSON_SCHEMA_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": Union[StrictInt, StrictFloat],
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _build_params_model(name: str, parameters: Dict[str, Any], required: List[str]) -> Optional[Type[BaseModel]]:
+    """Compile a tool's JSON Schema parameters into a pydantic model.
+    
+    Accepts either a full object schema or a bare mapping of property schemas.
+    Declared parameters are validated strictly, so "7" is not coerced to 7 or
+    "yes" to True. Undeclared parameters are allowed through unchanged.
+    """
+    properties = parameters.get("properties", parameters)
+    if not properties or not all(isinstance(spec, dict) for spec in properties.values()):
+        return None
+    
+    fields = {}
+    for field_name, spec in properties.items():
+        field_type = _JSON_SCHEMA_TYPES.get(spec.get("type"), Any)
+        if field_name in required:
+            fields[field_name] = (field_type, ...)
+        else:
+            fields[field_name] = (Optional[field_type], None)
+    
+    return create_model(
+        f"{name}Params",
+        __config__=ConfigDict(extra="allow", strict=True),
+        **fields
+    )
 
 
 class MCPTool(BaseModel):
@@ -55,12 +111,27 @@ class MCPTool(BaseModel):
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters schema")
     required: List[str] = Field(default_factory=list, description="Required parameters")
     handler: Optional[Callable] = Field(None, description="Handler function")
+    
+    # Validator for the parameters, compiled once at registration
+    _params_model: Optional[Type[BaseModel]] = PrivateAttr(None)
+    # Whether the handler is a coroutine function; sync handlers run in a worker thread
+    _is_async: bool = PrivateAttr(True)
+
+    def schema_view(self) -> Dict[str, Any]:
+        """Public schema of the tool, as listed to clients."""
+        return {
+            "description": self.description,
+            "parameters": self.parameters,
+            "required": self.required
+        }
 
 
 class MCPToolRegistry:
     """Registry for MCP tools."""
     _instance = None
     _tools: Dict[str, MCPTool] = {}
+    # Tool schemas, built once at registration for the listing endpoints
+    _schemas: Dict[str, Dict[str, Any]] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -72,7 +143,10 @@ class MCPToolRegistry:
         """Register a new tool."""
         def decorator(func: Callable) -> Callable:
             tool.handler = func
+            tool._is_async = inspect.iscoroutinefunction(func)
+            tool._params_model = _build_params_model(tool.name, tool.parameters, tool.required)
             cls._tools[tool.name] = tool
+            cls._schemas[tool.name] = tool.schema_view()
             return func
         return decorator
 
@@ -82,6 +156,11 @@ class MCPToolRegistry:
         return cls._tools.get(name)
 
     @classmethod
-    def list_tools(cls) -> Dict[str, MCPTool]:
-        """List all registered tools."""
-        return cls._tools.copy()
+    def list_tools(cls) -> Mapping[str, MCPTool]:
+        """List all registered tools as a read-only view."""
+        return MappingProxyType(cls._tools)
+
+    @classmethod
+    def list_schemas(cls) -> Mapping[str, Dict[str, Any]]:
+        """List the schemas of all registered tools as a read-only view."""
+        return MappingProxyType(cls._schemas)
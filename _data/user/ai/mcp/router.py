@@ -3,10 +3,10 @@ FastAPI router for MCP (Model Context Protocol) endpoints.
 """
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
-from .models import MCPRequest, MCPResponse, MCPTool
+from .models import MCPBatchRequest, MCPBatchResponse, MCPRequest, MCPResponse, MCPTool
 from .service import MCPService
 from .exceptions import MCPError, ToolNotFoundError, InvalidRequestError
 
@@ -17,11 +17,19 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Header names arrive lowercased from the ASGI server, so the raw bytes can be
+# compared against the prefix without decoding every header
+_CONFIG_PREFIX = b"x-config-"
+
 # Dependency to get MCP service
-def get_mcp_service() -> MCPService:
-    """Get MCP service instance."""
-    # In a real app, you would get the DB session from a dependency
-    return MCPService()
+async def get_mcp_service(request: Request) -> MCPService:
+    """Get the application's shared MCP service instance."""
+    # Async so FastAPI resolves it on the event loop rather than in a worker thread
+    service = getattr(request.app.state, 'mcp_service', None)
+    if service is None:
+        # Router included without register_mcp_routes
+        service = request.app.state.mcp_service = MCPService()
+    return service
 
 
 class MCPRequestModel(BaseModel):
@@ -31,38 +39,94 @@ class MCPRequestModel(BaseModel):
     context: Dict[str, Any] = {}
 
 
+class MCPBatchRequestModel(BaseModel):
+    """Request model for a batch of MCP operations."""
+    operations: List[MCPRequestModel]
+
+
+def _config_overrides(request: Request) -> Dict[str, str]:
+    """Collect the x-config-* headers used as configuration overrides."""
+    config_overrides = {}
+    for name, value in request.headers.raw:
+        if name.startswith(_CONFIG_PREFIX):
+            config_overrides[name.decode('latin-1')] = value.decode('latin-1')
+    return config_overrides
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model to JSON in one pass.
+    
+    Returning a Response skips FastAPI's response_model handling, which would
+    validate the model again before serializing it.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _to_mcp_request(mcp_request: MCPRequestModel, config_overrides: Dict[str, str]) -> MCPRequest:
+    """Build an MCPRequest, adding any config overrides to its context.
+    
+    The body was already validated as MCPRequestModel, so the request is
+    constructed without validating the same values a second time.
+    """
+    context = mcp_request.context or {}
+    if config_overrides:
+        context['config_overrides'] = dict(config_overrides)
+    
+    return MCPRequest.model_construct(
+        operation=mcp_request.operation,
+        parameters=mcp_request.parameters,
+        context=context
+    )
+
+
 @router.post("/execute", response_model=MCPResponse)
 async def execute_mcp_operation(
     request: Request,
     mcp_request: MCPRequestModel,
     mcp_service: MCPService = Depends(get_mcp_service)
-) -> MCPResponse:
+) -> Response:
     """
     Execute an MCP operation.
     
     This endpoint processes MCP requests and returns the operation result.
     """
     try:
-        # Extract headers for configuration overrides
-        config_overrides = {}
-        for key, value in request.headers.items():
-            if key.lower().startswith('x-config-'):
-                config_overrides[key] = value
+        # Create the MCP request with header config overrides in its context
+        request = _to_mcp_request(mcp_request, _config_overrides(request))
         
-        # Add config overrides to the context
-        context = mcp_request.context or {}
-        if config_overrides:
-            context['config_overrides'] = config_overrides
+        # Process the request
+        return _json_response(await mcp_service.process_request(request))
         
-        # Create the MCP request
-        request = MCPRequest(
-            operation=mcp_request.operation,
-            parameters=mcp_request.parameters,
-            context=context
+    except MCPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        
-        # Process the request
-        return await mcp_service.process_request(request)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.post("/execute-batch", response_model=MCPBatchResponse)
+async def execute_mcp_batch(
+    request: Request,
+    batch_request: MCPBatchRequestModel,
+    mcp_service: MCPService = Depends(get_mcp_service)
+) -> Response:
+    """
+    Execute several independent MCP operations concurrently.
+    
+    Responses are returned in the order the operations were submitted; a
+    failing operation is reported in its own response without affecting others.
+    """
+    try:
+        config_overrides = _config_overrides(request)
+        batch = MCPBatchRequest.model_construct(
+            operations=[_to_mcp_request(op, config_overrides) for op in batch_request.operations]
+        )
+        return _json_response(await mcp_service.process_batch(batch))
         
     except MCPError as e:
         raise HTTPException(
@@ -113,5 +177,7 @@ async def get_tool_schema(
 
 def register_mcp_routes(app):
     """Register MCP routes with the FastAPI application."""
+    # In a real app, the DB session would be passed in here
+    app.state.mcp_service = MCPService()
     app.include_router(router)
     return app
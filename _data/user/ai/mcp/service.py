@@ -1,15 +1,17 @@
 """
 MCP (Model Context Protocol) service for handling AI operations.
 """
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, List, Type, TypeVar, Union
-from uuid import UUID, uuid4
-from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, List, Type, TypeVar, Union
+from uuid import UUID
 
 from pydantic import BaseModel, ValidationError
 
 from .models import (
+    MCPBatchRequest,
+    MCPBatchResponse,
     MCPRequest,
     MCPResponse,
     MCPResult,
@@ -17,12 +19,38 @@ from .models import (
     MCPTool,
     MCPToolRegistry
 )
+from ...utils import utcnow_coarse, uuid7
 from .exceptions import MCPError, ToolNotFoundError, InvalidRequestError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Responses are assembled from values this module produces itself, so they are
+# built with model_construct and skip validation on every request
+
+def _completed_response(request_id: UUID, result: MCPResult) -> MCPResponse:
+    """Build the response for a successfully executed operation."""
+    return MCPResponse.model_construct(
+        request_id=request_id,
+        status=MCPStatus.COMPLETED,
+        result=result,
+        completed_at=utcnow_coarse()
+    )
+
+def _failed_response(request_id: UUID, error: str, error_type: str) -> MCPResponse:
+    """Build the response for a failed operation."""
+    return MCPResponse.model_construct(
+        request_id=request_id,
+        status=MCPStatus.FAILED,
+        result=MCPResult.model_construct(
+            success=False,
+            error=error,
+            metadata={"error_type": error_type}
+        ),
+        completed_at=utcnow_coarse()
+    )
+
 class MCPService:
     """Service for handling MCP operations."""
     
@@ -47,6 +75,7 @@ class MCPService:
         Returns:
             MCPResponse: Response containing the operation result
         """
+        request = None
         try:
             # Parse and validate the request
             if not isinstance(request_data, MCPRequest):
@@ -56,71 +85,81 @@ class MCPService:
                 
             logger.info(f"Processing MCP request: {request.request_id}")
             
-            # Get the tool for this operation
+            # Get the tool for this operation; unknown operations are answered
+            # directly rather than raised, logged with a traceback and caught
             tool = self.tool_registry.get_tool(request.operation)
             if not tool or not tool.handler:
-                raise ToolNotFoundError(f"Unknown operation: {request.operation}")
+                return _failed_response(
+                    request.request_id,
+                    f"Unknown operation: {request.operation}",
+                    ToolNotFoundError.__name__
+                )
+            
+            # Validate parameters with the tool's precompiled model; a
+            # ValidationError here is reported as an invalid request
+            parameters = request.parameters
+            if tool._params_model is not None:
+                parameters = tool._params_model.model_validate(parameters).model_dump(exclude_unset=True)
             
             # Execute the tool
             try:
-                result = await tool.handler(**request.parameters, context=request.context)
+                # Sync handlers run in a worker thread so they never block the loop
+                if tool._is_async:
+                    result = await tool.handler(**parameters, context=request.context)
+                else:
+                    result = await asyncio.to_thread(tool.handler, **parameters, context=request.context)
                 
                 # Convert result to MCPResult if it's not already
                 if not isinstance(result, MCPResult):
-                    result = MCPResult(
+                    result = MCPResult.model_construct(
                         success=True,
                         data=result if isinstance(result, dict) else {"result": result}
                     )
                 
-                return MCPResponse(
-                    request_id=request.request_id,
-                    status=MCPStatus.COMPLETED,
-                    result=result
-                )
+                return _completed_response(request.request_id, result)
                 
             except Exception as e:
                 logger.error(f"Error executing tool {request.operation}: {str(e)}", exc_info=True)
-                return MCPResponse(
-                    request_id=request.request_id,
-                    status=MCPStatus.FAILED,
-                    result=MCPResult(
-                        success=False,
-                        error=str(e),
-                        metadata={"error_type": e.__class__.__name__}
-                    )
-                )
+                return _failed_response(request.request_id, str(e), e.__class__.__name__)
                 
         except ValidationError as e:
             logger.error(f"Invalid MCP request: {str(e)}")
-            return MCPResponse(
-                request_id=getattr(request, 'request_id', uuid4()),
-                status=MCPStatus.FAILED,
-                result=MCPResult(
-                    success=False,
-                    error=f"Invalid request: {str(e)}",
-                    metadata={"error_type": "ValidationError"}
-                )
+            return _failed_response(
+                getattr(request, 'request_id', None) or uuid7(),
+                f"Invalid request: {str(e)}",
+                "ValidationError"
             )
             
         except Exception as e:
             logger.error(f"Unexpected error processing MCP request: {str(e)}", exc_info=True)
-            return MCPResponse(
-                request_id=getattr(request, 'request_id', uuid4()),
-                status=MCPStatus.FAILED,
-                result=MCPResult(
-                    success=False,
-                    error=f"Internal server error: {str(e)}",
-                    metadata={"error_type": e.__class__.__name__}
-                )
+            return _failed_response(
+                getattr(request, 'request_id', None) or uuid7(),
+                f"Internal server error: {str(e)}",
+                e.__class__.__name__
             )
     
-    def list_available_tools(self) -> Dict[str, Dict[str, Any]]:
-        """List all available tools with their schemas."""
-        tools = {}
-        for name, tool in self.tool_registry.list_tools().items():
-            tools[name] = {
-                "description": tool.description,
-                "parameters": tool.parameters,
-                "required": tool.required
-            }
-        return tools
+    async def process_batch(
+        self,
+        batch_data: Union[Dict[str, Any], MCPBatchRequest]
+    ) -> MCPBatchResponse:
+        """Process a batch of independent MCP requests concurrently.
+        
+        Args:
+            batch_data: Batch as dict or MCPBatchRequest instance
+            
+        Returns:
+            MCPBatchResponse: One response per operation, in submission order
+        """
+        batch = batch_data if isinstance(batch_data, MCPBatchRequest) else MCPBatchRequest(**batch_data)
+        
+        # process_request reports every failure in its response, so one
+        # failing operation never cancels the others
+        responses = await asyncio.gather(*(self.process_request(op) for op in batch.operations))
+        return MCPBatchResponse.model_construct(batch_id=batch.batch_id, responses=list(responses))
+    
+    def list_available_tools(self) -> Mapping[str, Dict[str, Any]]:
+        """List all available tools with their schemas.
+        
+        Schemas are precomputed at registration; this returns a read-only view.
+        """
+        return self.tool_registry.list_schemas()
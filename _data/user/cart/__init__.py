@@ -5,10 +5,14 @@ This package provides Pydantic models for handling shopping cart functionality,
 including cart items, summaries, and state management.
 """
 from .exceptions import CartError
-from .models import ProductVariant, CartItem, CartSummary, CartState
+from .models import ProductVariant, CartItem, CartSummary, CartState, CartOps
 
-# Default empty cart summary
-DEFAULT_CART_SUMMARY = CartSummary()
+def __getattr__(name):
+    """Build the default empty cart summary on first access."""
+    if name == 'DEFAULT_CART_SUMMARY':
+        summary = globals()['DEFAULT_CART_SUMMARY'] = CartSummary()
+        return summary
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'CartError',
@@ -16,5 +20,6 @@ __all__ = [
     'CartItem',
     'CartSummary',
     'CartState',
+    'CartOps',
     'DEFAULT_CART_SUMMARY'
 ]
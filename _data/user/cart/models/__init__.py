@@ -7,10 +7,12 @@ from .product_variant import ProductVariant
 from .cart_item import CartItem
 from .cart_summary import CartSummary
 from .cart_state import CartState
+from .cart_ops import CartOps
 
 __all__ = [
     'ProductVariant',
     'CartItem',
     'CartSummary',
     'CartState',
+    'CartOps',
 ]
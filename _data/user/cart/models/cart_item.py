@@ -3,13 +3,19 @@ Cart item model representing a product in the shopping cart.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
+from ...utils import utcnow_coarse
 from ..exceptions import CartError
 from .product_variant import ProductVariant
 
+# Fields the cached unit price is derived from
+_PRICE_FIELDS = frozenset({'price', 'selected_variant'})
+
 class CartItem(BaseModel):
     """An item in the shopping cart."""
+    model_config = ConfigDict(populate_by_name=True)
+    
     # Core product information
     id: str = Field(..., description="Unique identifier for the cart item")
     product_id: str = Field(
@@ -33,10 +39,10 @@ class CartItem(BaseModel):
         ge=1,
         description="Quantity of this item in the cart"
     )
-    subtotal: float = Field(
-        ...,
+    subtotal: Optional[float] = Field(
+        None,
         ge=0,
-        description="Total price for this line item (price * quantity)"
+        description="Total price for this line item (price * quantity); computed when omitted"
     )
     
     # Shipping and inventory
@@ -65,7 +71,7 @@ class CartItem(BaseModel):
         description="Customer notes or customization requests"
     )
     added_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow_coarse,
         alias="addedAt",
         description="When the item was added to the cart"
     )
@@ -74,6 +80,21 @@ class CartItem(BaseModel):
         description="Additional metadata for this cart item"
     )
     
+    # Resolved after validation and again whenever price or selected_variant
+    # is assigned, so reads don't re-check the variant
+    _unit_price: float = PrivateAttr(0.0)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _PRICE_FIELDS:
+            self._unit_price = self._resolved_unit_price()
+    
+    def _resolved_unit_price(self) -> float:
+        """Get the variant price if one is set, else the item price."""
+        if self.selected_variant and self.selected_variant.price is not None:
+            return self.selected_variant.price
+        return self.price
+    
     # Computed properties
     @property
     def variant_id(self) -> Optional[str]:
@@ -83,32 +104,22 @@ class CartItem(BaseModel):
     @property
     def unit_price(self) -> float:
         """Get the unit price, considering variant pricing if available."""
-        if self.selected_variant and self.selected_variant.price is not None:
-            return self.selected_variant.price
-        return self.price
+        return self._unit_price
     
     # Validators
-    @root_validator(pre=True)
-    def calculate_subtotal(cls, values):
-        """Calculate subtotal based on quantity and unit price."""
-        if 'subtotal' not in values:
-            quantity = values.get('quantity', 1)
-            unit_price = (
-                values.get('selected_variant', {}).get('price')
-                or values.get('price', 0)
-            )
-            values['subtotal'] = quantity * unit_price
-        return values
+    @model_validator(mode='after')
+    def resolve_unit_price(self):
+        """Store the unit price so reads don't re-check the variant, and
+        calculate the subtotal from it if none was given."""
+        self._unit_price = self._resolved_unit_price()
+        if self.subtotal is None:
+            self.subtotal = self.quantity * self._unit_price
+        return self
     
-    @validator('quantity')
-    def validate_quantity(cls, v):
-        """Ensure quantity is at least 1."""
-        if v < 1:
-            raise ValueError("Quantity must be at least 1")
-        return v
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump to a JSON-compatible dict using the camelCase aliases, omitting None values."""
+        return self.model_dump(mode='json', by_alias=True, exclude_none=True)
     
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes using the camelCase aliases, omitting None values."""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
@@ -0,0 +1,128 @@
+"""
+Cart item mutations shared by CartState and CartOps.
+
+Each mutation works on a cart's items list and the item id -> CartItem dict
+kept alongside it; the caller stamps the cart's updated_at.
+"""
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from ..exceptions import CartError
+from .cart_item import CartItem
+from .product_variant import ProductVariant
+
+class ProductLike(Protocol):
+    """Attributes add_item requires of a product or variant.
+
+    images, category, sku and requires_shipping are optional and are
+    resolved by _product_extras/_variant_extras.
+    """
+    id: Any
+    name: str
+    price: Any
+
+def _product_extras(product: ProductLike) -> Tuple[Optional[str], Optional[str], bool]:
+    """Resolve a product's optional image, category and requires_shipping in one place."""
+    images = getattr(product, 'images', None)
+    return (
+        images[0] if images else None,
+        getattr(product, 'category', None),
+        getattr(product, 'requires_shipping', True)
+    )
+
+def _variant_extras(variant: ProductLike) -> Tuple[Optional[str], bool]:
+    """Resolve a variant's optional sku and requires_shipping in one place."""
+    return getattr(variant, 'sku', None), getattr(variant, 'requires_shipping', True)
+
+@lru_cache(maxsize=4096)
+def cart_key(product_id: Any, variant_id: Optional[Any]) -> str:
+    """Build the cart item id for a product/variant pair.
+
+    Catalogs have a bounded set of pairs, so the interned key is reused on
+    every add instead of formatting a new string each time.
+    """
+    return sys.intern(f"{product_id}:{'base' if variant_id is None else variant_id}")
+
+def new_cart_item(
+    item_id: str,
+    product: ProductLike,
+    quantity: int,
+    variant: Optional[ProductLike],
+    notes: Optional[str]
+) -> CartItem:
+    """Build the cart item for a product/variant pair not yet in a cart."""
+    selected_variant = None
+    if variant:
+        sku, variant_requires_shipping = _variant_extras(variant)
+        selected_variant = ProductVariant(
+            id=variant.id,
+            name=variant.name,
+            price=float(variant.price),
+            sku=sku,
+            requires_shipping=variant_requires_shipping
+        )
+
+    image, category, requires_shipping = _product_extras(product)
+    return CartItem(
+        id=item_id,
+        product_id=product.id,
+        name=product.name,
+        price=float(product.price),
+        selected_variant=selected_variant,
+        quantity=quantity,
+        image=image,
+        category=category,
+        notes=notes,
+        requires_shipping=requires_shipping
+    )
+
+def index_items(items: List[CartItem]) -> Dict[str, CartItem]:
+    """Build the item id -> CartItem dict for an items list."""
+    return {item.id: item for item in items}
+
+def add_item(
+    items: List[CartItem],
+    index: Dict[str, CartItem],
+    product: ProductLike,
+    quantity: int = 1,
+    variant: Optional[ProductLike] = None,
+    notes: Optional[str] = None
+) -> None:
+    """Add an item to the cart or update quantity if it exists."""
+    if quantity < 1:
+        raise CartError("Quantity must be at least 1")
+
+    item_id = cart_key(product.id, variant.id if variant else None)
+    existing_item = index.get(item_id)
+
+    if existing_item:
+        # Update quantity of existing item
+        existing_item.quantity += quantity
+        existing_item.subtotal = existing_item.quantity * existing_item.unit_price
+    else:
+        new_item = new_cart_item(item_id, product, quantity, variant, notes)
+        items.append(new_item)
+        index[item_id] = new_item
+
+def remove_item(items: List[CartItem], index: Dict[str, CartItem], item_id: str) -> None:
+    """Remove an item from the cart by ID, keeping the order of the rest."""
+    item = index.pop(item_id, None)
+    if item is not None:
+        items.remove(item)
+
+def update_quantity(
+    items: List[CartItem],
+    index: Dict[str, CartItem],
+    item_id: str,
+    quantity: int
+) -> None:
+    """Update the quantity of an item, removing it when quantity drops below 1."""
+    if quantity < 1:
+        remove_item(items, index, item_id)
+        return
+
+    item = index.get(item_id)
+    if item is not None:
+        item.quantity = quantity
+        item.subtotal = item.unit_price * quantity
@@ -0,0 +1,117 @@
+"""
+Plain-Python cart mutations for hot paths.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...utils import utcnow_coarse
+from . import cart_mutations
+from .cart_item import CartItem
+from .cart_mutations import ProductLike
+from .cart_state import CartState
+
+@dataclass(slots=True)
+class _CartCore:
+    """Mutable cart state held outside pydantic."""
+    id: str
+    user_id: Optional[str]
+    items: List[CartItem]
+    created_at: datetime
+    updated_at: datetime
+    metadata: Dict[str, Any]
+    # item id -> CartItem, kept in step by the cart mutations
+    index: Dict[str, CartItem] = field(default_factory=dict)
+
+class CartOps:
+    """Cart mutations on a slotted dataclass, snapshotted to CartState on demand.
+
+    Runs the same cart mutations as CartState without going through BaseModel
+    attribute assignment on every change.
+    """
+    __slots__ = ('_core',)
+
+    def __init__(self, user_id: Optional[str] = None) -> None:
+        now = utcnow_coarse()
+        self._core = _CartCore(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            items=[],
+            created_at=now,
+            updated_at=now,
+            metadata={}
+        )
+
+    @classmethod
+    def from_state(cls, cart: CartState) -> 'CartOps':
+        """Start from a deep copy of an existing cart; later changes do not affect it."""
+        cart = cart.model_copy(deep=True)
+        ops = cls.__new__(cls)
+        ops._core = _CartCore(
+            id=cart.id,
+            user_id=cart.user_id,
+            items=cart.items,
+            created_at=cart.created_at,
+            updated_at=cart.updated_at,
+            metadata=cart.metadata,
+            index=cart_mutations.index_items(cart.items)
+        )
+        return ops
+
+    @property
+    def items(self) -> List[CartItem]:
+        """Items currently in the cart."""
+        return self._core.items
+
+    def add_item(
+        self,
+        product: ProductLike,
+        quantity: int = 1,
+        variant: Optional[ProductLike] = None,
+        notes: Optional[str] = None
+    ) -> 'CartOps':
+        """Add an item to the cart or update quantity if it exists."""
+        core = self._core
+        cart_mutations.add_item(core.items, core.index, product, quantity, variant, notes)
+        core.updated_at = utcnow_coarse()
+        return self
+
+    def remove_item(self, item_id: str) -> 'CartOps':
+        """Remove an item from the cart by ID."""
+        core = self._core
+        cart_mutations.remove_item(core.items, core.index, item_id)
+        core.updated_at = utcnow_coarse()
+        return self
+
+    def update_quantity(self, item_id: str, quantity: int) -> 'CartOps':
+        """Update the quantity of an item in the cart."""
+        core = self._core
+        cart_mutations.update_quantity(core.items, core.index, item_id, quantity)
+        core.updated_at = utcnow_coarse()
+        return self
+
+    def clear(self) -> 'CartOps':
+        """Remove all items from the cart."""
+        core = self._core
+        core.items = []
+        core.index = {}
+        core.updated_at = utcnow_coarse()
+        return self
+
+    def snapshot(self) -> CartState:
+        """Build a CartState from the current state without revalidating it.
+
+        The snapshot is a deep copy, so later mutations here do not leak into it.
+        """
+        core = self._core
+        state = CartState.model_construct(
+            id=core.id,
+            user_id=core.user_id,
+            items=core.items,
+            created_at=core.created_at,
+            updated_at=core.updated_at,
+            metadata=core.metadata
+        )
+        # The deep copy also builds the item index that model_construct skips
+        return state.model_copy(deep=True)
@@ -3,11 +3,13 @@ Cart state management and operations.
 """
 import uuid
 from datetime import datetime
-from typing import List, Optional, Dict, Any, TypeVar, Type, TYPE_CHECKING
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple, TypeVar, Type, Union, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, model_validator
 
-from ..exceptions import CartError
+from ...utils import utcnow_coarse
+from . import cart_mutations
 from .cart_item import CartItem
+from .cart_mutations import ProductLike
 from .cart_summary import CartSummary
 
 # Avoid circular imports
@@ -16,8 +18,12 @@ if TYPE_CHECKING:
 
 T = TypeVar('T', bound='CartState')
 
+_CART_ITEMS_ADAPTER = TypeAdapter(List[CartItem])
+
 class CartState(BaseModel):
     """Current state of the user's shopping cart."""
+    model_config = ConfigDict(populate_by_name=True)
+    
     id: str = Field(
         default_factory=lambda: str(uuid.uuid4()),
         description="Unique identifier for this cart"
@@ -32,12 +38,12 @@ class CartState(BaseModel):
         description="Items in the cart"
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow_coarse,
         alias="createdAt",
         description="When the cart was created"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow_coarse,
         alias="updatedAt",
         description="When the cart was last updated"
     )
@@ -46,84 +52,70 @@ class CartState(BaseModel):
         description="Additional cart metadata"
     )
     
+    # item id -> CartItem, kept in step by the cart methods (not serialized)
+    _item_index: Dict[str, CartItem] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode='after')
+    def index_items(self: T) -> T:
+        """Build the item index from the validated items list."""
+        self._item_index = cart_mutations.index_items(self.items)
+        return self
+    
+    def __deepcopy__(self: T, memo: Optional[Dict[int, Any]] = None) -> T:
+        # model_copy(deep=True) copies fields and private attrs separately, so
+        # the copied index would point at the original items
+        copied = super().__deepcopy__(memo)
+        copied.index_items()
+        return copied
+    
+    @classmethod
+    def from_items_raw(
+        cls: Type[T],
+        raw_items: Union[str, bytes, List[Dict[str, Any]]],
+        **fields: Any
+    ) -> T:
+        """Build a cart from stored items, validating the whole list in one call.
+        
+        raw_items may be the JSON text of the list (parsed directly by the
+        validator, with no json.loads step) or a list of dicts.
+        """
+        if isinstance(raw_items, (str, bytes)):
+            items = _CART_ITEMS_ADAPTER.validate_json(raw_items)
+        else:
+            items = _CART_ITEMS_ADAPTER.validate_python(raw_items)
+        # The items are already validated CartItem instances and are not revalidated
+        return cls(items=items, **fields)
+    
     # Cart methods
     def add_item(
         self: T,
-        product: 'ProductType',
+        product: Union['ProductType', ProductLike],
         quantity: int = 1,
-        variant: Optional['ProductVariantType'] = None,
+        variant: Optional[Union['ProductVariantType', ProductLike]] = None,
         notes: Optional[str] = None
     ) -> T:
         """Add an item to the cart or update quantity if it exists."""
-        if quantity < 1:
-            raise CartError("Quantity must be at least 1")
-        
-        # Create cart item from product
-        item_id = f"{product.id}:{variant.id if variant else 'base'}"
-        
-        # Check if item already exists in cart
-        existing_item = next((i for i in self.items if i.id == item_id), None)
-        
-        if existing_item:
-            # Update quantity of existing item
-            existing_item.quantity += quantity
-            existing_item.subtotal = existing_item.quantity * existing_item.unit_price
-        else:
-            # Create new cart item
-            from .product_variant import ProductVariant  # Avoid circular import
-            
-            selected_variant = None
-            if variant:
-                selected_variant = ProductVariant(
-                    id=variant.id,
-                    name=variant.name,
-                    price=float(variant.price),
-                    sku=getattr(variant, 'sku', None),
-                    requires_shipping=getattr(variant, 'requires_shipping', True)
-                )
-            
-            new_item = CartItem(
-                id=item_id,
-                product_id=product.id,
-                name=product.name,
-                price=float(product.price),
-                selected_variant=selected_variant,
-                quantity=quantity,
-                image=product.images[0] if hasattr(product, 'images') and product.images else None,
-                category=getattr(product, 'category', None),
-                notes=notes,
-                requires_shipping=getattr(product, 'requires_shipping', True)
-            )
-            
-            self.items.append(new_item)
-        
-        self.updated_at = datetime.utcnow()
+        cart_mutations.add_item(self.items, self._item_index, product, quantity, variant, notes)
+        self.updated_at = utcnow_coarse()
         return self
     
     def remove_item(self: T, item_id: str) -> T:
         """Remove an item from the cart by ID."""
-        self.items = [item for item in self.items if item.id != item_id]
-        self.updated_at = datetime.utcnow()
+        cart_mutations.remove_item(self.items, self._item_index, item_id)
+        self.updated_at = utcnow_coarse()
         return self
     
     def update_quantity(self: T, item_id: str, quantity: int) -> T:
         """Update the quantity of an item in the cart."""
-        if quantity < 1:
-            return self.remove_item(item_id)
-            
-        for item in self.items:
-            if item.id == item_id:
-                item.quantity = quantity
-                item.subtotal = item.unit_price * quantity
-                break
-                
-        self.updated_at = datetime.utcnow()
+        cart_mutations.update_quantity(self.items, self._item_index, item_id, quantity)
+        self.updated_at = utcnow_coarse()
         return self
     
     def clear(self: T) -> T:
         """Remove all items from the cart."""
         self.items = []
-        self.updated_at = datetime.utcnow()
+        self._item_index = {}
+        self.updated_at = utcnow_coarse()
         return self
     
     # Calculated properties
@@ -135,17 +127,28 @@ class CartState(BaseModel):
     @property
     def total_quantity(self) -> int:
         """Get the total quantity of all items in the cart."""
-        return sum(item.quantity for item in self.items)
+        return self._totals()[1]
     
     @property
     def subtotal(self) -> float:
         """Calculate the subtotal of all items in the cart."""
-        return sum(item.subtotal for item in self.items)
+        return self._totals()[0]
     
     @property
     def requires_shipping(self) -> bool:
         """Check if any items in the cart require shipping."""
-        return any(item.requires_shipping for item in self.items)
+        return self._totals()[2]
+    
+    def _totals(self) -> Tuple[float, int, bool]:
+        """Compute subtotal, total quantity and requires_shipping in one pass."""
+        subtotal = 0.0
+        total_quantity = 0
+        requires_shipping = False
+        for item in self.items:
+            subtotal += item.subtotal
+            total_quantity += item.quantity
+            requires_shipping = requires_shipping or item.requires_shipping
+        return subtotal, total_quantity, requires_shipping
     
     def get_summary(
         self,
@@ -154,7 +157,7 @@ class CartState(BaseModel):
         discount_amount: float = 0.0
     ) -> CartSummary:
         """Generate a summary of the cart's contents and costs."""
-        subtotal = self.subtotal
+        subtotal, total_quantity, requires_shipping = self._totals()
         
         # Calculate tax if rate is provided
         tax = 0.0
@@ -167,15 +170,16 @@ class CartState(BaseModel):
             shipping=shipping_cost,
             tax=tax,
             discount=discount_amount,
-            total=subtotal + shipping_cost + tax - discount_amount,
             item_count=self.item_count,
-            total_quantity=self.total_quantity,
-            requires_shipping=self.requires_shipping,
+            total_quantity=total_quantity,
+            requires_shipping=requires_shipping,
             tax_rate=tax_rate
         )
     
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump to a JSON-compatible dict using the camelCase aliases, omitting None values."""
+        return self.model_dump(mode='json', by_alias=True, exclude_none=True)
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes using the camelCase aliases, omitting None values."""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
@@ -2,10 +2,13 @@
 Cart summary model for order calculations.
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, root_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 class CartSummary(BaseModel):
     """Summary of the cart's contents and costs."""
+    # A value object: built once from a cart and only read afterwards
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     subtotal: float = Field(
         0.0,
         ge=0,
@@ -26,11 +29,6 @@ class CartSummary(BaseModel):
         ge=0,
         description="Total discount amount"
     )
-    total: float = Field(
-        0.0,
-        ge=0,
-        description="Grand total (subtotal + shipping + tax - discount)"
-    )
     item_count: int = Field(
         0,
         ge=0,
@@ -81,27 +79,26 @@ class CartSummary(BaseModel):
         description="Applied tax rate as a percentage"
     )
     
+    # Derived values
+    @computed_field(description="Grand total (subtotal + shipping + tax - discount)")
+    @property
+    def total(self) -> float:
+        """Grand total, never below zero."""
+        return max(0.0, self.subtotal + self.shipping + self.tax - self.discount)
+    
     # Validators
-    @root_validator
-    def calculate_totals(cls, values):
-        """Calculate derived values."""
-        subtotal = values.get('subtotal', 0)
-        shipping = values.get('shipping', 0)
-        tax = values.get('tax', 0)
-        discount = values.get('discount', 0)
-        
-        # Ensure tax is calculated if we have a rate but no tax amount
-        if 'tax' not in values and 'tax_rate' in values and values['tax_rate'] is not None:
-            tax = (subtotal - discount) * (values['tax_rate'] / 100)
-            values['tax'] = max(0, tax)
-        
-        # Calculate total
-        values['total'] = max(0, subtotal + shipping + tax - discount)
-        
-        return values
+    @model_validator(mode='after')
+    def calculate_tax(self):
+        """Calculate tax from the rate if a rate but no tax amount was given."""
+        if 'tax' not in self.model_fields_set and self.tax_rate is not None:
+            # The model is frozen; set the field directly while it is being built
+            object.__setattr__(self, 'tax', max(0, (self.subtotal - self.discount) * (self.tax_rate / 100)))
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump to a JSON-compatible dict using the camelCase aliases, omitting None values."""
+        return self.model_dump(mode='json', by_alias=True, exclude_none=True)
     
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {
-            'datetime': lambda v: v.isoformat(),
-        }
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes using the camelCase aliases, omitting None values."""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
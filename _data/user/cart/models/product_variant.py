@@ -1,12 +1,14 @@
 """
 Product variant model for cart items.
 """
-from datetime import datetime
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class ProductVariant(BaseModel):
     """Selected variant of a product in the cart."""
+    # A value object: a cart item's variant is replaced, never edited
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: str = Field(..., description="Unique identifier for the variant")
     name: str = Field(..., description="Display name of the variant")
     price: float = Field(..., ge=0, description="Price of this variant")
@@ -23,9 +25,3 @@ class ProductVariant(BaseModel):
         default_factory=dict,
         description="Additional variant-specific data"
     )
-
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+from .utils import HttpUrlStr
+
 class PII(BaseModel):
     """Personally Identifiable Information (PII) for the user.
     // todo: Ensure all PII fields are encrypted at rest in the DB layer.
@@ -69,12 +71,12 @@ class OnboardingStatus(BaseModel):
 class CompanyInfo(BaseModel):
     """Company information for users."""
     name: Optional[str] = Field(None, description="Company name")
-    website: Optional[HttpUrl] = Field(None, description="Company website URL")
-    logo_url: Optional[HttpUrl] = Field(None, description="URL to company logo")
+    website: Optional[HttpUrlStr] = Field(None, description="Company website URL")
+    logo_url: Optional[HttpUrlStr] = Field(None, description="URL to company logo")
     industry: Optional[str] = Field(None, description="Company industry")
     description: Optional[str] = Field(None, description="Company description")
     founded_year: Optional[int] = Field(None, description="Year company was founded")
-    linkedin_url: Optional[HttpUrl] = Field(None, description="Company LinkedIn URL")
+    linkedin_url: Optional[HttpUrlStr] = Field(None, description="Company LinkedIn URL")
 
 class CoreIdentity(BaseModel):
     """Core user identity, referencing PII, contact, and location models."""
@@ -1,7 +1,7 @@
 """
 GlobalKanban: Manages kanban boards, their states, and tasks with AI capabilities.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator, validator
 from typing import Any, Dict, List, Optional, Set
 from datetime import datetime
 from uuid import UUID, uuid4
@@ -106,25 +106,103 @@ class KanbanBoard(BaseModel):
             UUID: str
         }
     
+    # Secondary indexes over tasks (not serialized). Buckets are dicts keyed
+    # by task ID, used as insertion-ordered sets. Only the task methods below
+    # keep them in step with the tasks list.
+    _tasks_by_id: Dict[UUID, KanbanTask] = PrivateAttr(default_factory=dict)
+    _tasks_by_state: Dict[UUID, Dict[UUID, KanbanTask]] = PrivateAttr(default_factory=dict)
+    _tasks_by_assignee: Dict[UUID, Dict[UUID, KanbanTask]] = PrivateAttr(default_factory=dict)
+    _ai_tasks: Dict[UUID, KanbanTask] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode='after')
+    def index_tasks(self) -> 'KanbanBoard':
+        """Build the task indexes from the validated tasks list."""
+        self._tasks_by_id = {}
+        self._tasks_by_state = {}
+        self._tasks_by_assignee = {}
+        self._ai_tasks = {}
+        for task in self.tasks:
+            self._index_task(task)
+        return self
+    
     def update_timestamps(self):
         """Update the updated_at timestamp."""
         self.updated_at = datetime.utcnow()
     
+    def _index_task(self, task: KanbanTask) -> None:
+        """Add a task to every index."""
+        self._tasks_by_id[task.id] = task
+        self._tasks_by_state.setdefault(task.state_id, {})[task.id] = task
+        if task.assignee_id is not None:
+            self._tasks_by_assignee.setdefault(task.assignee_id, {})[task.id] = task
+        if task.is_ai_generated:
+            self._ai_tasks[task.id] = task
+    
+    def _unindex_task(self, task: KanbanTask) -> None:
+        """Remove a task from the state, assignee and AI indexes."""
+        self._tasks_by_state.get(task.state_id, {}).pop(task.id, None)
+        if task.assignee_id is not None:
+            self._tasks_by_assignee.get(task.assignee_id, {}).pop(task.id, None)
+        self._ai_tasks.pop(task.id, None)
+    
+    # Task management
+    def add_task(self, task: KanbanTask) -> None:
+        """Add a task to the board."""
+        if task.id in self._tasks_by_id:
+            raise ValueError(f"Task with ID {task.id} already exists")
+        self.tasks.append(task)
+        self._index_task(task)
+        self.update_timestamps()
+    
+    def remove_task(self, task_id: UUID) -> bool:
+        """Remove a task from the board."""
+        task = self._tasks_by_id.pop(task_id, None)
+        if task is None:
+            return False
+        self._unindex_task(task)
+        self.tasks.remove(task)
+        self.update_timestamps()
+        return True
+    
+    def move_task(self, task_id: UUID, state_id: UUID) -> bool:
+        """Move a task to another state."""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        self._unindex_task(task)
+        task.state_id = state_id
+        self._index_task(task)
+        task.update_timestamps()
+        self.update_timestamps()
+        return True
+    
+    def reassign_task(self, task_id: UUID, assignee_id: Optional[UUID]) -> bool:
+        """Assign a task to another user, or unassign it with None."""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        self._unindex_task(task)
+        task.assignee_id = assignee_id
+        self._index_task(task)
+        task.update_timestamps()
+        self.update_timestamps()
+        return True
+    
     def get_state_by_id(self, state_id: UUID) -> Optional[KanbanState]:
         """Get a state by its ID."""
         return next((s for s in self.states if s.id == state_id), None)
     
     def get_tasks_in_state(self, state_id: UUID) -> List[KanbanTask]:
         """Get all tasks in a specific state."""
-        return [t for t in self.tasks if t.state_id == state_id]
+        return list(self._tasks_by_state.get(state_id, {}).values())
     
     def get_ai_suggested_tasks(self) -> List[KanbanTask]:
         """Get all AI-suggested tasks."""
-        return [t for t in self.tasks if t.is_ai_generated]
+        return list(self._ai_tasks.values())
     
     def get_tasks_for_user(self, user_id: UUID) -> List[KanbanTask]:
         """Get all tasks assigned to a specific user."""
-        return [t for t in self.tasks if t.assignee_id == user_id]
+        return list(self._tasks_by_assignee.get(user_id, {}).values())
 
 
 class GlobalKanban(BaseModel):
@@ -135,11 +213,11 @@ class GlobalKanban(BaseModel):
         description="All kanban boards, keyed by board ID"
     )
     
-    # Caches (not persisted)
-    _user_boards_cache: Dict[UUID, Set[UUID]] = Field(
-        default_factory=dict,
-        description="Cache of user ID to set of board IDs they can access"
-    )
+    # Caches (not persisted): user ID -> board IDs they belong to, and the
+    # reverse board ID -> member user IDs, kept in step by the methods below
+    _user_boards_cache: Dict[UUID, Set[UUID]] = PrivateAttr(default_factory=dict)
+    _board_to_users: Dict[UUID, Set[UUID]] = PrivateAttr(default_factory=dict)
+    _indexed_boards: Optional[Dict[UUID, KanbanBoard]] = PrivateAttr(None)
     
     class Config:
         title = "GlobalKanban"
@@ -148,34 +226,79 @@ class GlobalKanban(BaseModel):
             datetime: lambda v: v.isoformat()
         }
     
+    def _membership_index(self) -> Dict[UUID, Set[UUID]]:
+        """Get the user -> boards map, building it once for boards loaded with the model."""
+        boards = self.boards
+        if self._indexed_boards is not boards or len(self._board_to_users) != len(boards):
+            self._user_boards_cache = {}
+            self._board_to_users = {}
+            for board in boards.values():
+                self._update_user_boards_cache(board)
+            self._indexed_boards = boards
+        return self._user_boards_cache
+    
     # Board management
     def add_board(self, board: KanbanBoard) -> None:
         """Add a new board to the global kanban."""
         if board.id in self.boards:
             raise ValueError(f"Board with ID {board.id} already exists")
+        self._membership_index()
         self.boards[board.id] = board
         self._update_user_boards_cache(board)
     
+    def remove_board(self, board_id: UUID) -> Optional[KanbanBoard]:
+        """Remove a board, dropping it from the boards of each of its members."""
+        self._membership_index()
+        board = self.boards.pop(board_id, None)
+        for user_id in self._board_to_users.pop(board_id, set()):
+            self._user_boards_cache[user_id].discard(board_id)
+        return board
+    
     def get_board(self, board_id: UUID) -> Optional[KanbanBoard]:
         """Get a board by ID."""
         return self.boards.get(board_id)
     
     def get_user_boards(self, user_id: UUID) -> List[KanbanBoard]:
         """Get all boards accessible by a user."""
-        if user_id not in self._user_boards_cache:
-            self._rebuild_user_boards_cache(user_id)
-        return [self.boards[bid] for bid in self._user_boards_cache.get(user_id, set())]
+        return [self.boards[bid] for bid in self._membership_index().get(user_id, ())]
+    
+    # Membership management
+    def add_member_to_board(self, board_id: UUID, member: BoardMember) -> bool:
+        """Add a member to a board; returns False if the board is unknown or they are already a member."""
+        board = self.boards.get(board_id)
+        if board is None:
+            return False
+        board_users = self._board_to_users_for(board_id)
+        if member.user_id in board_users:
+            return False
+        board.members.append(member)
+        board.update_timestamps()
+        board_users.add(member.user_id)
+        self._user_boards_cache.setdefault(member.user_id, set()).add(board_id)
+        return True
+    
+    def remove_member_from_board(self, board_id: UUID, user_id: UUID) -> bool:
+        """Remove a member from a board; returns False if they were not a member."""
+        board = self.boards.get(board_id)
+        if board is None:
+            return False
+        board_users = self._board_to_users_for(board_id)
+        if user_id not in board_users:
+            return False
+        board.members[:] = [m for m in board.members if m.user_id != user_id]
+        board.update_timestamps()
+        board_users.discard(user_id)
+        self._user_boards_cache[user_id].discard(board_id)
+        return True
+    
+    def _board_to_users_for(self, board_id: UUID) -> Set[UUID]:
+        """Get the member user IDs of a board from the index."""
+        self._membership_index()
+        return self._board_to_users.setdefault(board_id, set())
     
     def _update_user_boards_cache(self, board: KanbanBoard) -> None:
         """Update the user boards cache for all members of a board."""
+        board_users = self._board_to_users.setdefault(board.id, set())
         for member in board.members:
-            if member.user_id not in self._user_boards_cache:
-                self._user_boards_cache[member.user_id] = set()
-            self._user_boards_cache[member.user_id].add(board.id)
-    
-    def _rebuild_user_boards_cache(self, user_id: UUID) -> None:
-        """Rebuild the user boards cache for a specific user."""
-        self._user_boards_cache[user_id] = {
-            bid for bid, board in self.boards.items()
-            if any(m.user_id == user_id for m in board.members)
-        }
+            board_users.add(member.user_id)
+            self._user_boards_cache.setdefault(member.user_id, set()).add(board.id)
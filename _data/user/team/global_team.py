@@ -1,7 +1,7 @@
 """
 GlobalTeam: Centralized team management with members, invitations, activity tracking, and credit management.
 """
-from pydantic import BaseModel, Field, validator, HttpUrl
+from pydantic import BaseModel, Field, PrivateAttr, model_validator, validator, HttpUrl
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
@@ -84,7 +84,7 @@ class GlobalTeam(BaseModel):
     """
     id: UUID = Field(default_factory=uuid4, description="Unique team identifier")
     name: str = Field(..., description="Display name of the team", min_length=2, max_length=100)
-    slug: str = Field(..., description="URL-friendly team identifier", regex=r'^[a-z0-9-]+$')
+    slug: str = Field(..., description="URL-friendly team identifier", pattern=r'^[a-z0-9-]+$')
     owner_id: UUID = Field(..., description="User ID of the team owner")
     members: List[TeamMember] = Field(default_factory=list, description="List of team members")
     invitations: List[Invitation] = Field(default_factory=list, description="Pending invitations")
@@ -94,15 +94,28 @@ class GlobalTeam(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="When the team was created")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="When the team was last updated")
     
+    # Lookup indexes over the members and invitations lists (not serialized),
+    # kept in step by the member and invitation methods. Emails are
+    # lower-cased and map to the latest invitation sent to them.
+    _members_by_user_id: Dict[UUID, TeamMember] = PrivateAttr(default_factory=dict)
+    _invitations_by_email: Dict[str, Invitation] = PrivateAttr(default_factory=dict)
+    
     # Validators
     @validator('slug')
     def slug_must_be_lowercase(cls, v):
         return v.lower()
     
+    @model_validator(mode='after')
+    def build_indexes(self) -> 'GlobalTeam':
+        """Build the member and invitation indexes from the validated lists."""
+        self._members_by_user_id = {m.user_id: m for m in self.members}
+        self._invitations_by_email = {i.email.lower(): i for i in self.invitations}
+        return self
+    
     # Team Member Management
     def add_member(self, user_id: UUID, role: TeamRole = TeamRole.MEMBER) -> Optional[TeamMember]:
         """Add a new member to the team."""
-        if any(m.user_id == user_id for m in self.members):
+        if user_id in self._members_by_user_id:
             logger.warning(f"User {user_id} is already a member of team {self.id}")
             return None
             
@@ -113,41 +126,39 @@ class GlobalTeam(BaseModel):
             status=TeamMemberStatus.ACTIVE
         )
         self.members.append(member)
+        self._members_by_user_id[user_id] = member
         self.updated_at = datetime.utcnow()
         return member
     
     def remove_member(self, user_id: UUID) -> bool:
         """Remove a member from the team."""
-        initial_count = len(self.members)
-        self.members = [m for m in self.members if m.user_id != user_id]
-        if len(self.members) < initial_count:
-            self.updated_at = datetime.utcnow()
-            return True
-        return False
+        member = self._members_by_user_id.pop(user_id, None)
+        if member is None:
+            return False
+        self.members.remove(member)
+        self.updated_at = datetime.utcnow()
+        return True
     
     def get_member(self, user_id: UUID) -> Optional[TeamMember]:
         """Get a team member by user ID."""
-        for member in self.members:
-            if member.user_id == user_id:
-                return member
-        return None
+        return self._members_by_user_id.get(user_id)
     
     def update_member_role(self, user_id: UUID, new_role: TeamRole) -> bool:
         """Update a member's role."""
-        for member in self.members:
-            if member.user_id == user_id and member.role != new_role:
-                member.role = new_role
-                member.updated_at = datetime.utcnow()
-                self.updated_at = datetime.utcnow()
-                return True
-        return False
+        member = self._members_by_user_id.get(user_id)
+        if member is None or member.role == new_role:
+            return False
+        member.role = new_role
+        member.updated_at = datetime.utcnow()
+        self.updated_at = datetime.utcnow()
+        return True
     
     # Invitation Management
     def create_invitation(self, email: str, role: str, invited_by: UUID) -> Optional[Invitation]:
         """Create a new team invitation."""
         # Check for existing pending invitation
-        if any(i.email.lower() == email.lower() and i.status == InvitationStatus.PENDING 
-               for i in self.invitations):
+        existing = self._invitations_by_email.get(email.lower())
+        if existing is not None and existing.status == InvitationStatus.PENDING:
             logger.warning(f"Pending invitation already exists for {email}")
             return None
             
@@ -158,6 +169,7 @@ class GlobalTeam(BaseModel):
             invited_by=invited_by
         )
         self.invitations.append(invitation)
+        self._invitations_by_email[invitation.email] = invitation
         self.updated_at = datetime.utcnow()
         return invitation
     
@@ -216,9 +228,8 @@ class GlobalTeam(BaseModel):
     # Helper methods
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with proper serialization."""
-        result = self.dict(exclude={"members", "invitations"})
-        result["members"] = [m.dict() for m in self.members]
-        result["invitations"] = [i.dict() for i in self.invitations]
+        # One dump pass covers the members and invitations as well
+        result = self.dict()
         result["available_credits"] = self.credit_pool.available_credits
         result["member_count"] = len(self.members)
         result["pending_invitations"] = sum(
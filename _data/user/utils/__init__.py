@@ -0,0 +1,12 @@
+"""
+Shared helpers for the user data models.
+"""
+from .clock import utcnow_coarse, utcnow_coarse_aware, uuid7
+from .urls import HttpUrlStr
+
+__all__ = [
+    'HttpUrlStr',
+    'utcnow_coarse',
+    'utcnow_coarse_aware',
+    'uuid7',
+]
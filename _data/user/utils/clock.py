@@ -0,0 +1,64 @@
+"""
+Cheap timestamp and ID sources shared by the user data models.
+"""
+import os
+import time
+from datetime import datetime, timezone
+from typing import List
+from uuid import UUID
+
+# Timestamps within this many seconds of each other share one datetime
+_TICK = 0.001
+# Number of random UUID tails generated per refill of the pool
+_RANDOM_BATCH = 1024
+
+
+def _read_clock() -> List:
+    """Read the wall clock as [naive UTC, aware UTC, monotonic tick]."""
+    aware = datetime.now(timezone.utc)
+    return [aware.replace(tzinfo=None), aware, time.monotonic()]
+
+
+_now_cache = _read_clock()
+_random_pool: List[int] = []
+
+# A forked worker would otherwise draw the same random tails as its parent
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_random_pool.clear)
+
+
+def _refresh() -> None:
+    """Re-read the wall clock once the cached reading is older than a tick."""
+    if time.monotonic() - _now_cache[2] > _TICK:
+        _now_cache[:] = _read_clock()
+
+
+def utcnow_coarse() -> datetime:
+    """Get the current UTC time (naive, like utcnow), refreshed at most once per millisecond."""
+    _refresh()
+    return _now_cache[0]
+
+
+def utcnow_coarse_aware() -> datetime:
+    """Get the current UTC time (timezone-aware), refreshed at most once per millisecond."""
+    _refresh()
+    return _now_cache[1]
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (version 7).
+
+    48 bits of Unix milliseconds followed by random bits, so IDs created
+    later sort later and cluster together in indexes. The random bits come
+    from a pool refilled in bulk; forked children start with an empty pool.
+    """
+    if not _random_pool:
+        raw = os.urandom(10 * _RANDOM_BATCH)
+        _random_pool.extend(
+            int.from_bytes(raw[i:i + 10], "big")
+            for i in range(0, len(raw), 10)
+        )
+    value = (time.time_ns() // 1_000_000) << 80 | _random_pool.pop()
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
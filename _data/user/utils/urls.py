@@ -0,0 +1,21 @@
+"""
+Lightweight URL type for model fields.
+"""
+import re
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+_URL_RE = re.compile(r'^https?://[^\s]+$', re.IGNORECASE)
+
+
+def _url_ok(v: str) -> str:
+    """Check that v is an http(s) URL with no whitespace."""
+    if not _URL_RE.match(v):
+        raise ValueError("URL must start with http:// or https:// and contain no whitespace")
+    return v
+
+
+# An http(s) URL kept as a plain string. Only the scheme and shape are checked
+# on ingest; full URL parsing is left to where a URL is fetched.
+HttpUrlStr = Annotated[str, AfterValidator(_url_ok)]
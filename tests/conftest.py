@@ -0,0 +1,50 @@
+"""
+Make the models importable under their canonical package path.
+
+_data/user/__init__.py imports billing modules from the wrong location and
+ai/chat_threads/models/__init__.py imports config modules that do not exist
+at its relative path, so neither package can run its __init__. Both are
+registered as bare packages instead; every module the tests use is still
+imported from the repository unchanged.
+"""
+import importlib.machinery
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = 'config_lead_ignite'
+
+
+def _register_package(name: str, path: Path) -> None:
+    """Register a package module for a directory without running its __init__."""
+    if name in sys.modules:
+        return
+    module = types.ModuleType(name)
+    module.__path__ = [str(path)]
+    module.__spec__ = importlib.machinery.ModuleSpec(name, None, is_package=True)
+    module.__spec__.submodule_search_locations = module.__path__
+    sys.modules[name] = module
+
+
+_register_package(PACKAGE, REPO_ROOT)
+_register_package(f'{PACKAGE}._data', REPO_ROOT / '_data')
+_register_package(f'{PACKAGE}._data.user', REPO_ROOT / '_data' / 'user')
+_register_package(
+    f'{PACKAGE}._data.user.ai.chat_threads.models',
+    REPO_ROOT / '_data' / 'user' / 'ai' / 'chat_threads' / 'models'
+)
+
+
+def _export_models() -> None:
+    """Expose the importable chat thread models on their bare package."""
+    import importlib
+    models = sys.modules[f'{PACKAGE}._data.user.ai.chat_threads.models']
+    for name in ('base', 'message', 'thread'):
+        module = importlib.import_module(f'{models.__name__}.{name}')
+        for attr in dir(module):
+            if not attr.startswith('_'):
+                setattr(models, attr, getattr(module, attr))
+
+
+_export_models()
@@ -0,0 +1,79 @@
+"""
+Tests for A2AService send telemetry.
+"""
+import asyncio
+
+from config_lead_ignite._data.user.ai.a2a.models import ContentType, MessagePart, MessageType
+from config_lead_ignite._data.user.ai.a2a.service import A2AService
+
+
+def _service():
+    service = A2AService('a', 'Agent A', 'test agent')
+    service._telemetry_interval = 0.01
+    service.send_batch_enabled = False
+    return service
+
+
+def test_send_message_coerces_a_plain_string_type():
+    async def run():
+        service = _service()
+        message = await service.send_message('b', 'task', [])
+        assert message.message_type is MessageType.TASK
+        await asyncio.sleep(0.05)
+        # The drainer logged the record and stopped cleanly
+        assert service._telemetry_drainer is None
+        assert not service._telemetry
+
+    asyncio.run(run())
+
+
+def test_drainer_restarts_after_cancellation():
+    async def run():
+        service = _service()
+        await service.send_message('b', MessageType.TASK, [])
+        service._telemetry_drainer.cancel()
+        await asyncio.sleep(0)
+
+        await service.send_message('b', MessageType.MESSAGE, [])
+        drainer = service._telemetry_drainer
+        assert drainer is not None and not drainer.done()
+        await asyncio.sleep(0.05)
+        assert not service._telemetry
+
+    asyncio.run(run())
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.blobs = {}
+
+    async def put(self, digest, data):
+        self.blobs[digest] = data
+        return f'mem://{digest}'
+
+    async def get(self, ref):
+        return self.blobs[ref.removeprefix('mem://')]
+
+
+def test_binary_parts_stay_inline_without_a_blob_store():
+    async def run():
+        service = _service()
+        part = MessagePart(content_type=ContentType.IMAGE_PNG, content=b'png')
+        message = await service.send_message('b', MessageType.MESSAGE, [part])
+        assert message.parts[0].content == b'png'
+        assert message.parts[0].content_ref is None
+
+    asyncio.run(run())
+
+
+def test_binary_parts_sent_by_reference_through_a_blob_store():
+    async def run():
+        service = _service()
+        service.blob_store = _MemoryStore()
+        part = MessagePart(content_type=ContentType.IMAGE_PNG, content=b'png')
+        message = await service.send_message('b', MessageType.MESSAGE, [part])
+        sent = message.parts[0]
+        assert sent.content is None and sent.content_ref.startswith('mem://')
+        assert await service.get_part_content(sent) == b'png'
+
+    asyncio.run(run())
@@ -0,0 +1,112 @@
+"""
+Tests for the CartState and CartOps mutators.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from config_lead_ignite._data.user.cart import CartError, CartItem, CartOps, CartState, ProductVariant
+
+
+def _product(id, price=2.0):
+    return SimpleNamespace(id=id, name=id, price=price)
+
+
+def _cart(*ids):
+    cart = CartState()
+    for id in ids:
+        cart.add_item(_product(id))
+    return cart
+
+
+def test_add_existing_item_increments_quantity():
+    cart = _cart('a', 'b')
+    cart.add_item(_product('a'), quantity=2)
+    assert [(item.id, item.quantity) for item in cart.items] == [('a:base', 3), ('b:base', 1)]
+    assert cart.items[0].subtotal == 6.0
+
+
+def test_add_item_rejects_zero_quantity():
+    with pytest.raises(CartError):
+        _cart().add_item(_product('a'), quantity=0)
+
+
+@pytest.mark.parametrize('cart_type', [CartState, CartOps])
+def test_remove_item_keeps_the_order(cart_type):
+    cart = cart_type()
+    for id in 'abcd':
+        cart.add_item(_product(id))
+    cart.remove_item('a:base')
+    cart.update_quantity('c:base', 0)
+    cart.remove_item('x:base')
+    assert [item.id for item in cart.items] == ['b:base', 'd:base']
+
+
+def test_totals_follow_direct_edits():
+    cart = _cart('a', 'b')
+    assert (cart.subtotal, cart.total_quantity, cart.requires_shipping) == (4.0, 2, True)
+
+    cart.items[0].quantity = 10
+    cart.items[0].subtotal = 20.0
+    cart.items[1] = CartItem(id='c:base', product_id='c', name='c', price=5.0, requires_shipping=False)
+    cart.items[0].requires_shipping = False
+    summary = cart.get_summary()
+    assert (summary.subtotal, summary.total_quantity, summary.requires_shipping) == (25.0, 11, False)
+
+
+def test_unit_price_follows_price_and_variant_assignment():
+    item = CartItem(id='a:base', product_id='a', name='a', price=2.0)
+    item.price = 3.0
+    assert item.unit_price == 3.0
+    item.selected_variant = ProductVariant(id='v', name='v', price=7.0)
+    assert item.unit_price == 7.0
+    item.selected_variant = None
+    assert item.unit_price == 3.0
+
+
+def test_index_built_for_validated_and_copied_carts():
+    raw = '[{"id": "a:base", "productId": "a", "name": "a", "price": 2, "quantity": 3}]'
+    cart = CartState.from_items_raw(raw)
+    cart.add_item(_product('a'))
+    assert [(item.id, item.quantity) for item in cart.items] == [('a:base', 4)]
+
+    copied = cart.model_copy(deep=True)
+    copied.update_quantity('a:base', 1)
+    assert (copied.items[0].quantity, cart.items[0].quantity) == (1, 4)
+
+
+def test_cart_ops_matches_cart_state():
+    ops = CartOps()
+    cart = CartState()
+    for target in (ops, cart):
+        for id in 'abc':
+            target.add_item(_product(id))
+        target.add_item(_product('b'))
+        target.remove_item('a:base')
+        target.update_quantity('c:base', 5)
+    assert [(i.id, i.quantity) for i in ops.items] == [(i.id, i.quantity) for i in cart.items]
+
+    snapshot = ops.snapshot()
+    assert snapshot.subtotal == cart.subtotal
+    snapshot.add_item(_product('b'))
+    assert [i.quantity for i in snapshot.items] == [3, 5]
+    ops.update_quantity('b:base', 9)
+    assert snapshot.items[0].quantity == 3
+
+    resumed = CartOps.from_state(snapshot)
+    resumed.remove_item('b:base')
+    assert [i.id for i in resumed.items] == ['c:base']
+    assert len(snapshot.items) == 2
+
+
+def test_cart_ops_copies_are_deep():
+    cart = _cart('a')
+    cart.metadata['tags'] = ['x']
+    ops = CartOps.from_state(cart)
+    snapshot = ops.snapshot()
+
+    snapshot.metadata['tags'].append('y')
+    snapshot.items[0].metadata['note'] = 'n'
+    assert cart.metadata == {'tags': ['x']}
+    assert ops.snapshot().metadata == {'tags': ['x']}
+    assert ops.items[0].metadata == cart.items[0].metadata == {}
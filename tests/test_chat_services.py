@@ -0,0 +1,55 @@
+"""
+Tests for BaseService filtering over its field indexes.
+"""
+import asyncio
+from uuid import UUID, uuid4
+
+from config_lead_ignite._data.user.ai.chat_threads.models.base import BaseModelWithTimestamps
+from config_lead_ignite._data.user.ai.chat_threads.services.base import BaseService
+
+
+class _Profile(BaseModelWithTimestamps):
+    user_id: UUID
+    is_public: bool = False
+
+
+class _ProfileService(BaseService[_Profile]):
+    _indexed_fields = ('user_id', 'is_public')
+
+    def __init__(self):
+        super().__init__(_Profile)
+
+
+def test_indexed_filter_is_rechecked_on_candidates():
+    async def run():
+        service = _ProfileService()
+        user = uuid4()
+        shared = await service.create({'user_id': user, 'is_public': True})
+        await service.create({'user_id': user})
+
+        # The posting sets still list the profile as public, under the old user
+        shared.is_public = False
+        assert await service.list(is_public=True) == []
+        assert await service.count(is_public=True) == 0
+        shared.user_id = uuid4()
+        assert await service.count(user_id=user) == 1
+        assert await service.get_by(user_id=shared.user_id) is None
+
+    asyncio.run(run())
+
+
+def test_update_reindexes_and_stamps_updated_at():
+    async def run():
+        service = _ProfileService()
+        profile = await service.create({'user_id': uuid4()})
+        stamped = profile.updated_at
+
+        await service.update(profile.id, {'is_public': True})
+        assert await service.list(is_public=True) == [profile]
+        assert profile.updated_at >= stamped
+
+        assert await service.delete(profile.id)
+        assert await service.count(is_public=True) == 0
+
+    asyncio.run(run())
+
@@ -0,0 +1,41 @@
+"""
+Tests for the shared clock and ID helpers.
+"""
+import os
+
+import pytest
+
+from config_lead_ignite._data.user.utils import utcnow_coarse, utcnow_coarse_aware, uuid7
+
+
+def test_uuid7_is_version_7_unique_and_time_ordered():
+    ids = [uuid7() for _ in range(3000)]
+    assert len(set(ids)) == len(ids)
+    assert all(id.version == 7 for id in ids)
+    # Only the leading millisecond timestamp is ordered
+    stamps = [id.int >> 80 for id in ids]
+    assert stamps == sorted(stamps)
+
+
+def test_coarse_clocks_agree():
+    naive, aware = utcnow_coarse(), utcnow_coarse_aware()
+    assert naive.tzinfo is None
+    assert aware.tzinfo is not None
+    assert abs((aware.replace(tzinfo=None) - naive).total_seconds()) < 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_uuid7_differs_in_forked_child():
+    uuid7()  # fill the random pool before forking
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, uuid7().bytes)
+        os._exit(0)
+    os.close(write_fd)
+    child = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    # Both draws come from the tail of the same pool unless the child reset it
+    assert child[6:] != uuid7().bytes[6:]
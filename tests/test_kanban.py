@@ -0,0 +1,58 @@
+"""
+Tests for the KanbanBoard task indexes.
+"""
+from uuid import uuid4
+
+import pytest
+
+from config_lead_ignite._data.user.kanban.global_kanban import KanbanBoard
+from config_lead_ignite._data.user.kanban.kanban_task import KanbanTask
+
+ORG = uuid4()
+
+
+def _task(state_id, **fields):
+    return KanbanTask(
+        title='t',
+        state_id=state_id,
+        board_id=ORG,
+        organization_id=ORG,
+        reporter_id=ORG,
+        **fields
+    )
+
+
+def _board(*tasks):
+    return KanbanBoard(name='b', organization_id=ORG, created_by=ORG, tasks=list(tasks))
+
+
+def test_indexes_built_on_validation():
+    s1, s2, user = uuid4(), uuid4(), uuid4()
+    board = _board(_task(s1), _task(s2, assignee_id=user, is_ai_generated=True))
+
+    assert board.get_tasks_in_state(s1) == [board.tasks[0]]
+    assert board.get_tasks_for_user(user) == [board.tasks[1]]
+    assert board.get_ai_suggested_tasks() == [board.tasks[1]]
+
+
+def test_add_move_reassign_and_remove():
+    s1, s2, user = uuid4(), uuid4(), uuid4()
+    first = _task(s1)
+    board = _board(first)
+    task = _task(s1, assignee_id=user)
+    board.add_task(task)
+    board.add_task(_task(s1))
+    with pytest.raises(ValueError):
+        board.add_task(task)
+
+    assert board.move_task(task.id, s2)
+    assert board.reassign_task(task.id, None)
+    assert board.get_tasks_in_state(s1) == [first, board.tasks[2]]
+    assert board.get_tasks_in_state(s2) == [task]
+    assert board.get_tasks_for_user(user) == []
+
+    assert board.remove_task(task.id)
+    assert board.remove_task(task.id) is False
+    assert board.get_tasks_in_state(s2) == []
+    # Removal keeps the order of the remaining tasks
+    assert board.tasks[0] is first and len(board.tasks) == 2
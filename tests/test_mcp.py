@@ -0,0 +1,32 @@
+"""
+Tests for the compiled MCP tool parameter models.
+"""
+import pytest
+from pydantic import ValidationError
+
+from config_lead_ignite._data.user.ai.mcp.models import _build_params_model
+
+_PARAMS = {
+    'properties': {
+        'n': {'type': 'number'},
+        'i': {'type': 'integer'},
+        'b': {'type': 'boolean'},
+    }
+}
+
+
+def _validate(arguments):
+    model = _build_params_model('tool', _PARAMS, ['n'])
+    return model.model_validate(arguments).model_dump(exclude_unset=True)
+
+
+def test_arguments_keep_their_types():
+    assert _validate({'n': 5}) == {'n': 5}
+    assert type(_validate({'n': 5})['n']) is int
+    assert _validate({'n': 5.5, 'i': 3, 'b': False, 'extra': 'x'}) == {'n': 5.5, 'i': 3, 'b': False, 'extra': 'x'}
+
+
+@pytest.mark.parametrize('arguments', [{'n': '7'}, {'n': True}, {'n': 1, 'i': '7'}, {'n': 1, 'b': 'yes'}])
+def test_arguments_are_not_coerced(arguments):
+    with pytest.raises(ValidationError):
+        _validate(arguments)
@@ -0,0 +1,55 @@
+"""
+Tests for the GlobalTeam member and invitation indexes.
+"""
+from uuid import uuid4
+
+import pytest
+
+# Invitation uses EmailStr, which needs the optional email-validator package
+pytest.importorskip('email_validator')
+
+from config_lead_ignite._data.user.team.global_team import GlobalTeam, TeamRole  # noqa: E402
+
+
+def _team():
+    return GlobalTeam(name='Team', slug='team', owner_id=uuid4())
+
+
+def test_member_methods_keep_the_index():
+    team = _team()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    for user_id in (a, b, c):
+        team.add_member(user_id)
+    assert team.add_member(a) is None
+
+    assert team.update_member_role(b, TeamRole.ADMIN)
+    assert team.get_member(b).role == TeamRole.ADMIN
+    assert team.remove_member(b)
+    assert team.remove_member(b) is False
+    assert team.get_member(b) is None
+    # Removal keeps the join order
+    assert [m.user_id for m in team.members] == [a, c]
+
+
+def test_indexes_rebuilt_on_validation():
+    team = _team()
+    user_id = uuid4()
+    team.add_member(user_id)
+    team.create_invitation('a@x.com', 'member', uuid4())
+
+    restored = GlobalTeam.parse_obj(team.dict())
+    assert restored.get_member(user_id) is restored.members[0]
+    assert restored.create_invitation('A@x.com', 'member', uuid4()) is None
+
+
+def test_revoked_invitation_allows_a_new_one():
+    team = _team()
+    inviter = uuid4()
+    invitation = team.create_invitation('A@x.com', 'member', inviter)
+    assert team.create_invitation('a@X.com', 'member', inviter) is None
+
+    invitation.revoke()
+    assert team.to_dict()['pending_invitations'] == 0
+    assert team.create_invitation('a@x.com', 'member', inviter) is not None
+    assert team.create_invitation('a@x.com', 'member', inviter) is None
+    assert team.to_dict()['pending_invitations'] == 1
@@ -0,0 +1,56 @@
+"""
+Tests for the Thread participant index and participant updates.
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from config_lead_ignite._data.user.ai.chat_threads.models.base import ParticipantRole
+from config_lead_ignite._data.user.ai.chat_threads.models.thread import Participant, Thread
+
+
+def test_participant_methods_keep_the_index():
+    thread = Thread()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    for user_id in (a, b, c):
+        thread.add_participant(user_id)
+    with pytest.raises(ValueError):
+        thread.add_participant(b)
+
+    assert thread.update_participant_role(b, 'admin')
+    assert thread.get_participant(b).role == 'admin'
+    assert thread.remove_participant(b)
+    assert thread.remove_participant(b) is False
+    assert thread.get_participant(b) is None
+    # Removal keeps the join order
+    assert [p.user_id for p in thread.participants] == [a, c]
+
+
+def test_index_rebuilt_on_validation():
+    thread = Thread()
+    user_id = uuid4()
+    thread.add_participant(user_id)
+
+    restored = Thread.model_validate(thread.model_dump())
+    assert restored.get_participant(user_id) == restored.participants[0]
+    copied = thread.model_copy(deep=True)
+    assert copied.get_participant(user_id) is copied.participants[0]
+
+
+def test_construction_stamps_only_a_missing_updated_at():
+    participant = Participant(thread_id=uuid4(), user_id=uuid4())
+    assert participant.updated_at is not None
+
+    stored = datetime(2020, 1, 1)
+    loaded = Participant.model_validate({**participant.model_dump(), 'updated_at': stored})
+    assert loaded.updated_at == stored
+
+
+def test_role_update_stores_the_enum_value():
+    thread = Thread()
+    user_id = uuid4()
+    thread.add_participant(user_id)
+    thread.update_participant_role(user_id, ParticipantRole.ADMIN)
+    role = thread.get_participant(user_id).role
+    assert type(role) is str and role == 'admin'
@@ -0,0 +1,22 @@
+"""
+Tests for the shared URL field type.
+"""
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from config_lead_ignite._data.user.utils import HttpUrlStr
+
+
+class _Link(BaseModel):
+    url: HttpUrlStr
+
+
+@pytest.mark.parametrize('url', ['https://example.com', 'http://x/a?b=1', 'HTTP://EXAMPLE.COM'])
+def test_url_accepted(url):
+    assert _Link(url=url).url == url
+
+
+@pytest.mark.parametrize('url', ['https://', 'https://a b', 'ftp://example.com', 'example.com'])
+def test_url_rejected(url):
+    with pytest.raises(ValidationError):
+        _Link(url=url)